@@ -47,11 +47,20 @@ class Apparatus:
     VENDORS = HIDDEN+"vendors/"
     #path to workspaces within legohdl
     WORKSPACE = HIDDEN+"workspaces/"
+    #path to plugins within legohdl
+    PLUGINS = HIDDEN+"plugins/"
+    #path to profiles within legohdl
+    PROFILES = HIDDEN+"profiles/"
+    #path to tokenized HDL files kept between runs
+    HDL_CACHE = HIDDEN+"hdl_cache/"
 
     #all available options allowed to be edited within the legohdl.cfg
     #append all non-field options here (editable dictionaries)
     OPTIONS = ['label', 'plugin', 'workspace', 'vendor', 'placeholders', 'metadata']
 
+    #accepted values for the default-language setting
+    DEFAULT_LANGS = frozenset(['vhdl', 'verilog', 'auto'])
+
     LAYOUT = { 'general' : {
                     'active-workspace' : Cfg.NULL, 
                     'author' : Cfg.NULL, 
@@ -101,6 +110,8 @@ class Apparatus:
     VERILOG_CODE = ["*.v", "*.sv"]
 
     SRC_CODE = VHDL_CODE + VERILOG_CODE
+    #lower-case file extensions (with '.') of SRC_CODE for membership tests
+    SRC_EXTS = frozenset([e.lstrip('*').lower() for e in SRC_CODE])
 
     #this character can be used on the CLI proceeding a block's title to specify
     #an entity
@@ -108,6 +119,15 @@ class Apparatus:
 
     DOCUMENTATION_URL = 'https://c-rus.github.io/legoHDL/'
 
+    #paths are case-sensitive when running on Linux (determined once)
+    ON_LINUX = (platform.system() == "Linux")
+
+    #store previously formatted paths from fs()
+    _FsCache = dict()
+
+    #number of paths remembered by fs() before starting over
+    FS_CACHE_LIMIT = 4096
+
 
     @classmethod
     def initialize(cls):
@@ -119,13 +139,9 @@ class Apparatus:
         #ask for 1st time user setup if the base directory does not exist
         ask_for_setup = (os.path.exists(cls.HIDDEN) == False)
         
-        #make sure directories exist
-        os.makedirs(cls.HIDDEN, exist_ok=True)
-        os.makedirs(cls.HIDDEN+"workspaces/", exist_ok=True)
-        os.makedirs(cls.HIDDEN+"plugins/", exist_ok=True)
-        os.makedirs(cls.VENDORS, exist_ok=True)
-        os.makedirs(cls.TEMPLATE, exist_ok=True)
-        os.makedirs(cls.HIDDEN+"profiles/", exist_ok=True)
+        #make sure directories exist (restores any that were removed by the user)
+        for d in [cls.HIDDEN, cls.WORKSPACE, cls.PLUGINS, cls.VENDORS, cls.TEMPLATE, cls.PROFILES]:
+            os.makedirs(d, exist_ok=True)
 
         #read legohd.cfg file
     
@@ -142,8 +158,8 @@ class Apparatus:
         cls.CFG.set('', Section(cls.LAYOUT), override=False)
 
         #create empty import.log file for profiles if DNE
-        if(os.path.isfile(cls.HIDDEN+"profiles/"+cls.PRFL_LOG) == False):
-            open(cls.HIDDEN+"profiles/"+cls.PRFL_LOG, 'w').close()
+        if(os.path.isfile(cls.PROFILES+cls.PRFL_LOG) == False):
+            open(cls.PROFILES+cls.PRFL_LOG, 'w').close()
 
         #return if user was missing the legohdl hidden folder
         return ask_for_setup
@@ -161,7 +177,7 @@ class Apparatus:
         '''
         #validate that default-language is one of 3 options
         dl = cls.CFG.get('hdl-styling.default-language')
-        if(dl.lower() not in ['vhdl', 'verilog', 'auto']):
+        if(dl.lower() not in cls.DEFAULT_LANGS):
             dl = cls.CFG.set('hdl-styling.default-language', 'auto')
 
         #ensure the alignment setting is constrained between 0 and 80
@@ -207,9 +223,8 @@ class Apparatus:
         Returns:
             (bool): true if path starts with inner_path 
         '''
-        kernel = platform.system()
         #must be careful to exactly match paths within Linux OS
-        if(kernel != "Linux"):
+        if(cls.ON_LINUX == False):
             inner_path = inner_path.lower()
             path = path.lower()
 
@@ -228,9 +243,8 @@ class Apparatus:
         Returns:
             (bool): true if path1 == path2
         '''
-        kernel = platform.system()
         #must be careful to exactly match paths within Linux OS
-        if(kernel != "Linux"):
+        if(cls.ON_LINUX == False):
             path1 = path1.lower()
             path2 = path2.lower()
 
@@ -247,7 +261,7 @@ class Apparatus:
         Returns:
             (str): the path to the temporary directory
         '''
-        tmp_path = cls.fs(cls.HIDDEN+"tmp/")
+        tmp_path = cls.fs(cls.TMP)
         #check if temporary directory already exists
         cls.cleanTmpDir()
         #create temporary directory
@@ -259,7 +273,7 @@ class Apparatus:
     def cleanTmpDir(cls):
         '''Remove the tmporary directory within legoHDL.'''
 
-        tmp_path = cls.fs(cls.HIDDEN+"tmp/")
+        tmp_path = cls.fs(cls.TMP)
         #check if temporary directory already exists
         if(os.path.exists(tmp_path)):
             shutil.rmtree(tmp_path, onerror=cls.rmReadOnly)
@@ -423,18 +437,20 @@ class Apparatus:
     def save(cls):
         '''
         Saves the current multi-level Section CFG object its legohdl.cfg file.
+        Skips writing the file if no settings were modified since last read/write.
 
         Parameters:
             None
         Returns:
             None
         '''
-        cls.CFG.write()
+        if(cls.CFG._modified):
+            cls.CFG.write()
         pass
     
 
     @classmethod
-    def execute(cls, *code, subproc=False, quiet=True, returnoutput=False):
+    def execute(cls, *code, subproc=False, quiet=True, returnoutput=False, returncode=False):
         '''
         Execute the command and runs it through the terminal. 
         
@@ -446,9 +462,11 @@ class Apparatus:
             subproc (bool): run in subprocess if true else use os.system()
             quiet (bool): display the command being executed
             returnoutput (bool): uses subprocess to retun stdout and stderr
+            returncode (bool): also return the exit status if `returnoutput` is true
         Returns:
             stdout (str): standard output if `returnoutput` is true
             stderr (str): error output if `returnoutput` is true
+            rc (int): exit status if `returnoutput` and `returncode` are true
         '''
         #compile all variable arguments into single string separated by spaces
         code_line = ''
@@ -462,6 +480,8 @@ class Apparatus:
             proc = subprocess.Popen([*code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.PIPE)
             out = proc.stdout.read()
             err = proc.stderr.read()
+            if(returncode):
+                return out.decode().strip(), err.decode().strip(), proc.wait()
             return out.decode().strip(), err.decode().strip()
         #use subprocess
         if(subproc):
@@ -495,8 +515,15 @@ class Apparatus:
         Similar to os.path.normcase(path).
         '''
         #do not format the path if it is a URL or path is empty
-        if(path == None or path == '' or path.lower().startswith('http') or \
-            path.lower().startswith('git@')):
+        if(path == None or path == ''):
+            return path
+        #return the previously formatted path
+        if(path in cls._FsCache.keys()):
+            return cls._FsCache[path]
+
+        raw_path = path
+        if(path.lower().startswith(('http', 'git@'))):
+            cls._FsCache[raw_path] = path
             return path
 
         #expand the env variables
@@ -514,6 +541,10 @@ class Apparatus:
         if(last_slash > dot and path[-1] != '/'):
             path = path + '/'
         
+        #remember the result for future calls with the same path
+        if(len(cls._FsCache) >= cls.FS_CACHE_LIMIT):
+            cls._FsCache.clear()
+        cls._FsCache[raw_path] = path
         return path
 
 
@@ -676,22 +707,26 @@ class Apparatus:
             total (int): number of bytes within the 'path'
         '''
         #return 0 if path DNE
-        if(os.path.exists(path) == False):
+        try:
+            st = os.stat(path)
+        except OSError:
             return 0
         #base case: return the file's size in bytes
-        elif(os.path.isfile(path) == True):
-            return os.path.getsize(path)
+        if(stat.S_ISREG(st.st_mode)):
+            return st.st_size
         #standardize the path's format
         path = cls.fs(path)
         #ensure the last character in path is '/' for concatenation purposes
         if(path[-1] != '/'):
             path = path + '/'
-        #recursively add each sub directory/file
-        dirs = os.listdir(path)
         total = 0
-        #iterate through all sub-paths
-        for d in dirs:
-            total += cls.getPathSize(path+d)
+        #recursively add each sub directory/file (entries cache their type)
+        with os.scandir(path) as entries:
+            for e in entries:
+                if(e.is_file()):
+                    total += e.stat().st_size
+                else:
+                    total += cls.getPathSize(path+e.name)
 
         return total
 
@@ -8,7 +8,7 @@
 #   root folder.
 # ------------------------------------------------------------------------------
 
-import os, shutil, stat, glob
+import os, shutil, stat, glob, re, fnmatch, tempfile
 import logging as log
 from datetime import date
 from enum import Enum
@@ -49,14 +49,20 @@ class Block:
     REQ_KEYS = ['name', 'library', 'version', 'remote', 'vendor', 'requires']
 
     #metadata that gets added as block loses detail (at AVAIL or VERS level)
-    EXTRA_KEYS = ['versions', 'size', 'vhdl-units', 'vlog-units']
+    EXTRA_KEYS = frozenset(['versions', 'size', 'vhdl-units', 'vlog-units'])
+
+    #metadata keys in [block] that are returned as lists
+    LIST_KEYS = frozenset(['requires', 'vhdl-units', 'vlog-units', 'versions'])
 
     #supported files to be identified as "changelogs"
-    CHANGE_LOGS = ['changelog.md', 'change.log', 'changelog.txt']
+    CHANGE_LOGS = frozenset(['changelog.md', 'change.log', 'changelog.txt'])
 
     #class attribute that is a block object found on current path
     _Current = None
 
+    #class attribute storing the process's working directory (read once)
+    _Cwd = None
+
     #class container listing storing all created blocks
     Inventory = Map()
 
@@ -66,6 +72,34 @@ class Block:
     #an unreleased block's version number
     NULL_VER = 'v0.0.0'
 
+    #a full (3-place) version as accepted by validVer(), with an optional 'v'
+    VER_FORMAT = re.compile(r'[vV]?\d+[._]\d+[._]\d+[._]?')
+
+    #class containers storing previously parsed/validated version strings
+    _VerParts = dict()
+    _ValidVers = dict()
+
+    #permission bits toggled by modWritePermissions()
+    WRITE_MASK = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+    #class container storing previously split titles
+    _TitleParts = dict()
+
+    #class container storing the settings-derived placeholders with their date
+    _StaticPlaceholders = None
+
+    #class container storing the HDL-styling settings read from the config
+    _Styling = None
+
+    #class container storing each repository's legohdl tags with its refs timestamps
+    _TagCache = dict()
+
+    #number of times a level in the Inventory has been filled or emptied
+    _InvVersion = 0
+
+    #class container storing the blocks from getAllBlocks() with the _InvVersion they match
+    _AllBlocks = None
+
 
     def __init__(self, path, ws, lvl=Level.DNLD):
         '''
@@ -92,21 +126,15 @@ class Block:
             self._path,_ = os.path.split(path)
             self._path = apt.fs(self._path)
             pass
-        #try to see if a Block marker is within this directory
-        elif(os.path.isdir(path)):
-            files = os.listdir(path)
-            for f in files:
-                if(f == apt.MARKER):
-                    self._path = apt.fs(path)
-                    break
+        #a directory path is already stored as-is; isValid() checks for its marker
         #check if valid
         if(self.isValid()):
-            #create Git object if is download block or main installation
+            #allow a Git object if is download block or main installation (created by getRepo())
             if(self._lvl == Block.Level.DNLD or self._lvl == Block.Level.INSTL or \
                 self._lvl == Block.Level.TMP):
-                self._repo = Git(self.getPath())
+                self._has_repo = True
             #are the two paths equal to each other? then this is the current block
-            if(apt.isEqualPath(self.getPath(), os.getcwd())):
+            if(apt.isEqualPath(self.getPath(), Block.getCwd())):
                 self.setCurrent(self)
                 
             #load from metadata
@@ -124,6 +152,28 @@ class Block:
         pass
 
 
+    def getRepo(self):
+        '''
+        Returns the _repo (Git) attr. Creates it on first use for blocks that
+        are allowed a repository (downloads, installations, and temporaries).
+
+        Parameters:
+            None
+        Returns:
+            _repo (Git): the block's git repository object (None if not allowed)
+        '''
+        if(hasattr(self, '_repo') == False):
+            if(self.hasRepo() == False):
+                return None
+            self._repo = Git(self.getPath())
+        return self._repo
+
+
+    def hasRepo(self):
+        '''Returns (bool) if the block has a repository, without creating its Git object.'''
+        return hasattr(self, '_repo') or hasattr(self, '_has_repo')
+
+
     @classmethod
     def setCurrent(cls, b):
         cls._Current = b
@@ -146,36 +196,33 @@ class Block:
             (bool): determine if the block was successfully added (spot empty)
         '''
         #make sure appropriate scopes exists in inventory
-        if(self.M().lower() not in Block.Inventory.keys()):
-            Block.Inventory[self.M()] = Map()
-        if(self.L().lower() not in Block.Inventory[self.M()].keys()):
-            Block.Inventory[self.M()][self.L()] = Map()
+        lib_map = Block.Inventory.setdefault(self.M(), Map())
+        name_map = lib_map.setdefault(self.L(), Map())
         #define empty tuple for all of a block's levels
-        if(self.N().lower() not in Block.Inventory[self.M()][self.L()].keys()):
-            Block.Inventory[self.M()][self.L()][self.N()] = [None, None, None]
+        lvls = name_map.setdefault(self.N(), [None, None, None])
         #check if the level location is empty
         lvl = self.getLvl().value
-        if(lvl < len(Block.Inventory[self.M()][self.L()][self.N()])):
-            if(Block.Inventory[self.M()][self.L()][self.N()][lvl] != None):
+        if(lvl < len(lvls)):
+            if(lvls[lvl] != None):
                 log.error("Block "+self.getFull()+" already exists at level "+str(lvl)+"!")
                 return False
             #add to inventory if spot is empty
             else:
-                Block.Inventory[self.M()][self.L()][self.N()][lvl] = self
+                lvls[lvl] = self
+                Block._InvVersion += 1
 
         if(self.getMeta('requires') != None):
             #update graph
-            #print(self.getFull(inc_ver=True))
-            Block.Hierarchy.addVertex(self.getFull(inc_ver=True))
-            #print(self.getFull(inc_ver=True))
+            full_title = self.getFull(inc_ver=True)
+            Block.Hierarchy.addVertex(full_title)
+            trimVerChain = Block.trimVerChain
+            addEdge = Block.Hierarchy.addEdge
             for d in self.getMeta('requires'):
                 #remove any partial versions from identifier in requires
-                at_i = d.rfind('@')
-                v_i = d.rfind('(')
-                d = d[:v_i+1] + d[at_i:]
+                d = trimVerChain(d)
                 #add edge to graph
                 #print(d)
-                Block.Hierarchy.addEdge(self.getFull(inc_ver=True), d)
+                addEdge(full_title, d)
                 pass
 
         return True
@@ -188,6 +235,22 @@ class Block:
         return cls._Current
 
 
+    @classmethod
+    def getCwd(cls, refresh=False):
+        '''
+        Returns the current working directory, only asking the os for it on the
+        first call (or when refresh is set).
+
+        Parameters:
+            refresh (bool): determine if to re-read the working directory
+        Returns:
+            _Cwd (str): the current working directory
+        '''
+        if(cls._Cwd == None or refresh):
+            cls._Cwd = os.getcwd()
+        return cls._Cwd
+
+
     def getWorkspace(self):
         '''Returns the block's workspace _ws (Workspace).'''
         return self._ws
@@ -234,19 +297,43 @@ class Block:
         instl._instls = Map()
 
         #get all folders one path below
-        base_path,_ = os.path.split(instl.getPath()[:len(instl.getPath())-1])
+        base_path,_ = os.path.split(instl.getPath()[:-1])
         base_path = apt.fs(base_path)
-        dirs = os.listdir(base_path)
-        for d in dirs:
-            if(Block.validVer(d, places=[1,2,3])):
-                path = apt.fs(base_path+d+'/')
-                instl._instls[d] = Block(path, instl.getWorkspace(), lvl=Block.Level.VER)
+        ws = instl.getWorkspace()
+        validVer = Block.validVer
+        ver_lvl = Block.Level.VER
+        with os.scandir(base_path) as entries:
+            for e in entries:
+                #only directories can be version installations
+                if(e.is_dir(follow_symlinks=False) == False):
+                    continue
+                if(validVer(e.name, places=[1,2,3])):
+                    #base path is already formatted and version names need no fixing
+                    instl._instls[e.name] = Block(e.path+'/', ws, lvl=ver_lvl)
+            pass
 
         if(returnvers):
                 return list(instl._instls.keys())
         return instl._instls
 
 
+    def clearInstalls(self):
+        '''
+        Forget the installer's computed map of specific installations so the
+        next getInstalls() call rescans the cache. Call after adding or removing
+        a version installation.
+
+        Parameters:
+            None
+        Returns:
+            None
+        '''
+        instl = self.getLvlBlock(Block.Level.INSTL)
+        if(instl != None and hasattr(instl, '_instls')):
+            del instl._instls
+        pass
+
+
     def delete(self, prompt=False, squeeze=0):
         '''
         Deletes the block object. Removes its path. Does not update any class variables,
@@ -277,8 +364,10 @@ class Block:
         shutil.rmtree(self.getPath(), onerror=apt.rmReadOnly)
 
         #remove from inventory
-        if(self.getLvl().value < len(lvls)):
-            Block.Inventory[self.M()][self.L()][self.N()][self.getLvl().value] = None
+        lvl = self.getLvl().value
+        if(lvl < len(lvls)):
+            lvls[lvl] = None
+            Block._InvVersion += 1
 
         #display message to user indicating deletion was successful
         if(self.getLvl() == Block.Level.DNLD):
@@ -292,8 +381,10 @@ class Block:
             #step back 1 directory
             nested,_ = os.path.split(nested)
             #print(nested)
-            #try to remove this directory
-            if(len(os.listdir(nested)) == 0):
+            #try to remove this directory (stop scanning at its first entry)
+            with os.scandir(nested) as entries:
+                empty = (next(entries, None) == None)
+            if(empty):
                 shutil.rmtree(nested, onerror=apt.rmReadOnly)
             #not encountering empty directories anymore
             else:
@@ -356,19 +447,22 @@ class Block:
     def getHighestTaggedVersion(self):
         '''
         Returns the highest tagged version for this block's repository or (v0.0.0 
-        if none found).
+        if none found). Dynamically creates attr _highest_ver to be used again.
 
         Parameters:
             None
         Returns:
-            highest (str): highest version in format ('v0.0.0')
+            _highest_ver (str): highest version in format ('v0.0.0')
         '''
+        if(hasattr(self, '_highest_ver')):
+            return self._highest_ver
+
         all_vers = self.getTaggedVersions()
-        highest = 'v0.0.0'
-        for v in all_vers:
-            if(self.cmpVer(highest,v) == v):
-                highest = v
-        return highest
+        self._highest_ver = 'v0.0.0'
+        #compare on the cached (major,minor,patch) parts, keeping the last of equal versions
+        if(len(all_vers)):
+            self._highest_ver = max(reversed(all_vers), key=Block.sepVer)
+        return self._highest_ver
 
 
     def waitOnChangelog(self, ver):
@@ -398,15 +492,13 @@ class Block:
 
         #open the changelog and wait for the developer to finish writing changes
         apt.execute(apt.getEditor(), cl)
+        #editors may detach from the terminal, so wait on the developer's signal
+        prompt = "Enter 'k' when done writing CHANGELOG to proceed..."
         try:
-            resp = input("Enter 'k' when done writing CHANGELOG to proceed...")
+            while(input(prompt).strip().lower() != 'k'):
+                prompt = ''
         except KeyboardInterrupt:
             exit('\nExited prompt. Release cancelled.')
-        while resp.lower() != 'k':
-            try:
-                resp = input()
-            except KeyboardInterrupt:
-                exit('\nExited prompt. Release cancelled.')
 
         return True
 
@@ -421,32 +513,30 @@ class Block:
         Returns:
             _changelog (str): filepath for the changelog
         '''
-        if(hasattr(self, "_changelog")):
-            if(rel_path and self._changelog != None):
-                return self._changelog.replace(self.getPath(), '')
-            elif(returnname):
-                return os.path.split(self._changelog)[1]
-            return self._changelog
-
-        #get all files
-        all_files = glob.glob(self.getPath()+"**/*", recursive=True)
-        self._changelog = None
-        #iterate through all results to find a changelog
-        for f in all_files:
-            #skip all non-files found
-            if(os.path.isfile(f) == False):
-                continue
-            #extract the filename
-            _,fname = os.path.split(f)
-            #check if filename matches a supported changelog file
-            if(fname.lower() in Block.CHANGE_LOGS):
-                self._changelog = f
-                break
+        if(hasattr(self, "_changelog") == False):
+            self._changelog = None
+            #take the first supported changelog in the same order as a recursive glob
+            for e in Block.walkEntries(self.getPath()):
+                #skip hidden files (hidden directories are not entered)
+                if(e.name[0] == '.'):
+                    continue
+                #check if filename matches a supported changelog file
+                if(e.name.lower() in Block.CHANGE_LOGS and os.path.isfile(e.path)):
+                    self._changelog = e.path
+                    break
+                pass
+            #store the relative path and filename views alongside the full path
+            self._changelog_rel = None
+            self._changelog_name = None
+            if(self._changelog != None):
+                self._changelog_rel = self._changelog.replace(self.getPath(), '')
+                self._changelog_name = os.path.split(self._changelog)[1]
             pass
+
         if(rel_path and self._changelog != None):
-            return self._changelog.replace(self.getPath(), '')
+            return self._changelog_rel
         elif(returnname):
-            return os.path.split(self._changelog)[1]
+            return self._changelog_name
         return self._changelog
 
 
@@ -496,7 +586,7 @@ class Block:
         self.secureMeta()
 
         #verify user has permission to write to remote if it exists
-        if(self._repo.hasWritePermission() == False):
+        if(self.getRepo().hasWritePermission() == False):
             log.error("Unable to release block due to invalid write permissions for block's remote repository!")
             return
 
@@ -506,15 +596,16 @@ class Block:
             return
 
         #make sure the repository is up to date (silence print to console on none-remote repos to avoid confusion)
-        if(self._repo.remoteExists()):
+        remote_exists = self.getRepo().remoteExists()
+        if(remote_exists):
             log.info("Verifying repository is up-to-date...")
-        up2date, connected = self._repo.isLatest()
+        up2date, connected = self.getRepo().isLatest()
         if(connected == False):
             return
         if(up2date == False):
             log.error("Verify the repository is up-to-date before releasing.")
             return
-        if(self._repo.remoteExists()):
+        if(remote_exists):
             log.info("Success.")
 
         highest_ver = self.getHighestTaggedVersion()
@@ -585,13 +676,14 @@ class Block:
 
         #update dynamic attributes
         self._V = next_ver
+        if(hasattr(self, "_full_titles")):
+            del self._full_titles
         self._tags += [next_ver]
+        self._highest_ver = next_ver
 
         self.setMeta('version', next_ver[1:])
 
-        #check updates on block requirements
-        block_reqs = self.updateRequires(dry_run=dry_run, quiet=True)
-        #add text for block requirements found
+        #add text for block requirements found (already updated before the stability check)
         release_report = release_report + 'Block Requirements:\n'
         req_txt = '    N/A'
         if(len(block_reqs)):
@@ -605,34 +697,36 @@ class Block:
         #4. Make a new git commit
 
         if(only_meta and dry_run == False):
-            self._repo.add(apt.MARKER)
+            #stage the metadata and changelog together in a single git call
             if(changelog_altered):
-                self._repo.add(self.getChangelog(rel_path=True))
+                self.getRepo().add(apt.MARKER, self.getChangelog(rel_path=True))
+            else:
+                self.getRepo().add(apt.MARKER)
         elif(dry_run == False):
-            self._repo.add('.')
+            self.getRepo().add('.')
 
         #insert default message
         if(msg == None):
             msg = "Releases legohdl version "+next_ver
 
         #get what branch currently on
-        cur_branch = self._repo.getBranch()
+        cur_branch = self.getRepo().getBranch()
         release_report = release_report + "Branch: "+cur_branch+"\n"
         release_report = release_report + "Commit message: "+msg+"\n"
         if(dry_run == False):
-            self._repo.commit(msg)
+            self.getRepo().commit(msg)
 
         #5. Create a new git tag
         
         release_report = release_report + "Git tag: "+next_ver+apt.TAG_ID+"\n"
         if(dry_run == False):
-            self._repo.git('tag',next_ver+apt.TAG_ID)
+            self.getRepo().git('tag',next_ver+apt.TAG_ID)
 
         #6. Push to remote and to vendor if applicable
 
         #synch changes with remote repository
         if(dry_run == False):
-            self._repo.push()
+            self.getRepo().push()
 
         #7. install latest version to the cache
         if(no_install == False and dry_run == False):
@@ -658,7 +752,7 @@ class Block:
             publish = False
 
         #check if the block has a remote repo in order to publish to vendor
-        if(self._repo.remoteExists() == False):
+        if(self.getRepo().remoteExists() == False):
             log.warning("Unable to publish to vendor "+vndr.getName()+" because a remote repository is not configured.")
             publish = False
 
@@ -728,22 +822,21 @@ class Block:
         '''
         #check current block's requirements first
         #split identifier found in metadata
-        spec_vers = []
+        spec_vers = set()
         #track what blocks to use latest
-        use_latest = []
+        use_latest = set()
         for r in block_reqs:
             _,_,_,ver = Block.snapTitle(r)
+            ver = ver.lower()
             #the block relies on a block from downloads -> unstable design
-            if(ver.lower().count('unstable')):
+            if('unstable' in ver):
                 return False
             #add the title only as specific version
-            at_i = r.rfind('@')
-            v_i = r.rfind('(')
-            spec_v = r[:v_i+1].lower() + r[at_i:].lower()
-            spec_vers += [spec_v]
+            spec_v = Block.trimVerChain(r).lower()
+            spec_vers.add(spec_v)
             #remember which to use latest for
-            if(ver.lower().count('latest')):
-                use_latest += [spec_v]
+            if('latest' in ver):
+                use_latest.add(spec_v)
             pass
 
         #print('specific versions:',spec_vers)
@@ -751,9 +844,17 @@ class Block:
         #check requirements for neighboring vertices
         next_blocks = Block.Hierarchy.getNeighbors(self.getFull(inc_ver=True)) 
         #ignore edges that aren't matched in requirements
-        next_blocks = list(filter(lambda a: a in spec_vers, next_blocks))
+        next_blocks = [a for a in next_blocks if a in spec_vers]
         #create stack
         neighbor_blocks = [(next_blocks, use_latest)]
+        #track which requirements (and how they were used) have been checked
+        visited = set()
+        #bind frequently accessed class members to locals for the traversal loop
+        inventory = Block.Inventory
+        instl_lvl = Block.Level.INSTL.value
+        snapTitle = Block.snapTitle
+        trimVerChain = Block.trimVerChain
+        getNeighbors = Block.Hierarchy.getNeighbors
         #print(neighbor_blocks)
         while(len(neighbor_blocks)):
             #grab a block's requirements and the use latest list
@@ -761,29 +862,35 @@ class Block:
             gs, ul = neighbor_blocks.pop()
             #iterate through every block
             for b_id in gs:
+                #skip requirements already checked under the same latest/specific usage
+                b_low = b_id.lower()
+                b_key = (b_low, b_low in ul)
+                if(b_key in visited):
+                    continue
+                visited.add(b_key)
                 #access this block from its identifier
-                V,L,N,ver = Block.snapTitle(b_id)
+                V,L,N,ver = snapTitle(b_id)
 
                 #remove leading '@' symbol
                 ver = ver[1:]
                 #guaranteed to be from cache because checked for 'unstables' beforehand
 
                 #access the block from installation at the specific version
-                if(V in Block.Inventory.keys() and L in Block.Inventory[V].keys() and N in Block.Inventory[V][L].keys()):
+                if(V in inventory.keys() and L in inventory[V].keys() and N in inventory[V][L].keys()):
                     #print('block id:',b_id)
                     #print("use-latest list:",ul)
-                    if(Block.Inventory[V][L][N][Block.Level.INSTL.value] != None):
-                        #get latest install block
-                        target_block = Block.Inventory[V][L][N][Block.Level.INSTL.value]
+                    #get latest install block
+                    target_block = inventory[V][L][N][instl_lvl]
+                    if(target_block != None):
                         #grab specific block if not using latest (the latest's specific version may not be installed)
-                        if(b_id.lower() not in ul):
-                            ver_blocks = Block.Inventory[V][L][N][Block.Level.INSTL.value].getInstalls()
+                        if(b_key[1] == False):
+                            ver_blocks = target_block.getInstalls()
                             #print(ver_blocks)
                             if(ver not in ver_blocks.keys()):
                                 #should not encounter this error
                                 log.error("Unidentified version '"+ver+"' from block requirement "+b_id)
                                 return False
-                            target_block = target_block.getInstalls()[ver]
+                            target_block = ver_blocks[ver]
                             pass
                         #access requirements from the target block
                         reqs = target_block.getMeta('requires')
@@ -795,34 +902,33 @@ class Block:
                     return False
 
                 #reset spec_ver list
-                spec_vers = []
+                spec_vers = set()
                 #reset use latest list
-                use_latest = []
+                use_latest = set()
 
                 #check the requirements in metadata
                 for r in reqs:
                     #split identifier found in metadata
-                    _,_,_,ver = Block.snapTitle(r)
+                    _,_,_,ver = snapTitle(r)
+                    ver = ver.lower()
                     #print('reading:',ver)
                     #the block relies on a block from downloads -> unstable design
-                    if(ver.lower().count('unstable')):
+                    if('unstable' in ver):
                         return False
                     #add the title only as specific version
-                    at_i = r.rfind('@')
-                    v_i = r.rfind('(')
-                    spec_v = r[:v_i+1].lower() + r[at_i:].lower()
-                    spec_vers += [spec_v]
+                    spec_v = trimVerChain(r).lower()
+                    spec_vers.add(spec_v)
                     #remember which to use latest for
-                    if(ver.lower().count('latest')):
-                        use_latest += [spec_v]
+                    if('latest' in ver):
+                        use_latest.add(spec_v)
                     pass
 
                 #add this block's requirements to stack
-                next_blocks = Block.Hierarchy.getNeighbors(b_id)
-                #ignore edges that aren't matched in requirements
-                next_blocks = list(filter(lambda a: a in spec_vers, next_blocks))
-                #add to the list
-                neighbor_blocks = [(next_blocks, use_latest)] + neighbor_blocks
+                next_blocks = getNeighbors(b_id)
+                #ignore edges that aren't matched in requirements or were already checked
+                next_blocks = [a for a in next_blocks if a in spec_vers and (a, a in use_latest) not in visited]
+                #add to the stack
+                neighbor_blocks.append((next_blocks, use_latest))
                 pass
 
             pass
@@ -832,36 +938,11 @@ class Block:
 
     def sortVersions(self, unsorted_vers):
         '''
-        Returns a list from highest to lowest using merge sort.
+        Returns a list from highest to lowest. Each version is parsed once into
+        its (major,minor,patch) values and sorted with python's built-in sort.
+        Equal versions keep the reverse of their given order.
         '''
-
-
-        def mergeSort(l1, r1):
-            '''
-            Mergesort (2/2) - begin merging lists.
-            '''
-            sorting = []
-            while len(l1) and len(r1):
-                if(Block.cmpVer(l1[0],r1[0]) == r1[0]):
-                    sorting.append(r1.pop(0))
-                else:
-                    sorting.append(l1.pop(0))
-            if(len(l1)):
-                sorting = sorting + l1
-            if(len(r1)):
-                sorting = sorting + r1
-            return sorting
-
-
-        #split list
-        midpoint = int(len(unsorted_vers)/2)
-        l1 = unsorted_vers[:midpoint]
-        r1 = unsorted_vers[midpoint:]
-        #recursive call to continually split list
-        if(len(unsorted_vers) > 1):
-            return mergeSort(self.sortVersions(l1), self.sortVersions(r1))
-        else:
-            return unsorted_vers
+        return sorted(reversed(unsorted_vers), key=Block.sepVer, reverse=True)
 
 
     def getHighestAvailVersion(self):
@@ -907,10 +988,24 @@ class Block:
         '''
         if(hasattr(self, '_tags')):
             return self._tags
-        if(hasattr(self, '_repo') == False):
+        if(self.hasRepo() == False):
             return []
 
-        all_tags,_ = self._repo.git('tag','-l')
+        #tags can only have changed if the tag references were modified
+        repo_path = self.getRepo().getPath()
+        stamp = []
+        for ref in ['.git/refs/tags', '.git/packed-refs']:
+            try:
+                stamp += [os.stat(repo_path+ref).st_mtime_ns]
+            except OSError:
+                stamp += [None]
+        stamp = tuple(stamp)
+        #reuse the tags read by another block object for this repository
+        if(repo_path in Block._TagCache.keys() and Block._TagCache[repo_path][0] == stamp):
+            self._tags = list(Block._TagCache[repo_path][1])
+            return self._tags
+
+        all_tags,_ = self.getRepo().git('tag','-l')
 
         #print(all_tags)
         #split into list
@@ -923,9 +1018,12 @@ class Block:
                 #trim off identifier
                 t = t[:t.find(apt.TAG_ID)]
                 #ensure it is valid version format
-                if(self.validVer(t)):
+                if(Block.VER_FORMAT.fullmatch(t) != None):
                     self._tags.append(t)
 
+        #only remember tags when their references could be timestamped
+        if(stamp != (None, None)):
+            Block._TagCache[repo_path] = (stamp, list(self._tags))
         #print(self._tags)
         #return all tags
         return self._tags
@@ -1001,6 +1099,12 @@ class Block:
         Returns:
             (bool): if 'ver' meets the version requirements for validation
         '''
+        #return the previously determined result
+        key = (ver, tuple(places))
+        if(key in cls._ValidVers.keys()):
+            return cls._ValidVers[key]
+        cls._ValidVers[key] = False
+
         #standardize the version string
         ver = cls.stdVer(ver)
         #split the version into its parts
@@ -1020,9 +1124,25 @@ class Block:
                 return False
 
         #valid version if passes test for all parts being decimal
+        cls._ValidVers[key] = True
         return True
     
 
+    @classmethod
+    def trimVerChain(cls, title):
+        '''
+        Removes any partial versions from a title's version chain, leaving only
+        the specific version (ex: 'lib.name(v1.0-@v1.0.2)' -> 'lib.name(@v1.0.2)').
+        Without a '(' only the '@' tail is returned (ex: 'v1.0-@v1.0.2' -> '@v1.0.2').
+
+        Parameters:
+            title (str): block title with a version chain in parentheses
+        Returns:
+            (str): block title with only the specific version
+        '''
+        return title[:title.rfind('(')+1] + title[title.rfind('@'):]
+
+
     @classmethod
     def sepVer(cls, ver):
         '''
@@ -1035,27 +1155,25 @@ class Block:
             r_minor (int): middle version number
             r_patch (int): smallest version number
         '''
+        #return the previously separated version
+        if(ver in cls._VerParts.keys()):
+            return cls._VerParts[ver]
+        raw_ver = ver
+
         ver = cls.stdVer(ver)
         if(ver == '' or ver == None):
+            cls._VerParts[raw_ver] = (0,0,0)
             return 0,0,0
         if(ver[0] == 'v'):
             ver = ver[1:]
 
         first_dot = ver.find('.')
         last_dot = ver.rfind('.')
+        #non-numeric (or missing) parts are treated as 0
+        parts = (ver[:first_dot], ver[first_dot+1:last_dot], ver[last_dot+1:])
+        r_major,r_minor,r_patch = [int(p) if(p.isdecimal()) else 0 for p in parts]
 
-        try:
-            r_major = int(ver[:first_dot])
-        except:
-            r_major = 0
-        try:
-            r_minor = int(ver[first_dot+1:last_dot])
-        except:
-            r_minor = 0
-        try:
-            r_patch = int(ver[last_dot+1:])
-        except:
-            r_patch = 0
+        cls._VerParts[raw_ver] = (r_major,r_minor,r_patch)
         return r_major,r_minor,r_patch
 
 
@@ -1086,7 +1204,7 @@ class Block:
  
         self.save()
 
-        if(hasattr(self, "_repo")):
+        if(self.hasRepo()):
             #grab highest available version
             correct_ver = self.getHighestTaggedVersion()[1:]   
             #dynamically determine the latest valid release point
@@ -1094,19 +1212,19 @@ class Block:
 
             #check value in metadata if a valid remote to set different than repo's data
             rem = self.getMeta('remote')
-            if(rem != self._repo.getRemoteURL()):
+            if(rem != Cfg.NULL and Git.isEqualURL(rem, self.getRepo().getRemoteURL()) == False):
                 #validate its remote connection
                 if(Git.isValidRepo(rem, remote=True)):
-                    self._repo.setRemoteURL(rem)
+                    self.getRepo().setRemoteURL(rem)
 
             #set the remote correctly
-            self.setMeta('remote', self._repo.getRemoteURL())
+            self.setMeta('remote', self.getRepo().getRemoteURL())
             pass
 
         #ensure the vendor is valid
         if(self.getMeta('vendor') != Cfg.NULL):
             m = self.getMeta('vendor')
-            if(m.lower() not in self.getWorkspace().getVendors(returnnames=True)):
+            if(self.getWorkspace().hasVendor(m) == False):
                 #log.warning("Vendor "+m+" from "+self.getFull()+" is not available in this workspace.")
                 pass
             pass
@@ -1231,8 +1349,7 @@ class Block:
             return False
 
         #make sure Block.cfg files do not exist beyond the current directory
-        md_files = glob.glob(self.getPath()+"**/"+apt.MARKER, recursive=True)
-        if(len(md_files) > 0 and self.isValid() == False):
+        if(self.isValid() == False and self.hasSubBlocks()):
             log.error("Cannot initialize a block when sub-directories are blocks.")
             return False
 
@@ -1250,15 +1367,14 @@ class Block:
         if(cp_template and os.path.exists(self.getPath()) == False):
             log.info("Copying in template...")
             template = apt.getTemplatePath()
-            shutil.copytree(template, self.getPath())
-            #delete any previous git repository that was attached to template
-            if(Git.isValidRepo(self.getPath())):
-                shutil.rmtree(self.getPath()+"/.git/", onerror=apt.rmReadOnly)
-            #delete all folders that start with '.'
-            dirs = os.listdir(self.getPath())
-            for d in dirs:
-                if(os.path.isdir(self.getPath()+d) and d[0] == '.'):
-                    shutil.rmtree(self.getPath()+d, onerror=apt.rmReadOnly)
+            #never copy the template's root folders that start with '.' (such as
+            #a git repository that was attached to the template)
+            def skipHiddenDirs(src, names):
+                if(src != template):
+                    return []
+                return [n for n in names if(n[0] == '.' and os.path.isdir(os.path.join(src, n)))]
+
+            shutil.copytree(template, self.getPath(), ignore=skipHiddenDirs)
         #ensure this path exists before beginning to create the block
         else:
             os.makedirs(self.getPath(), exist_ok=True)
@@ -1277,7 +1393,7 @@ class Block:
 
         #check if vendor is in an allowed vendor
         if(M != ''):
-            if(M.lower() in self.getWorkspace().getVendors(returnnames=True)):
+            if(self.getWorkspace().hasVendor(M)):
                 self.setMeta("vendor", M)
             else:
                 log.warning("Skipping invalid vendor name "+M+"...")
@@ -1289,27 +1405,39 @@ class Block:
 
         #fill in placeholders
         if(cp_template):
-            template_files = glob.glob(self.getPath()+"/**/*", recursive=True)
+            #gather every non-hidden file within the new block
+            template_files = []
+            dirs = [self.getPath()]
+            while(len(dirs)):
+                with os.scandir(dirs.pop()) as entries:
+                    for e in entries:
+                        if(e.name.startswith('.')):
+                            continue
+                        if(e.is_file()):
+                            template_files.append(e.path)
+                        elif(e.is_dir()):
+                            dirs.append(e.path)
+                        pass
+                pass
             for tf in template_files:
-                if(os.path.isfile(tf)):
-                    self.fillPlaceholders(tf, self.N())
+                self.fillPlaceholders(tf, self.N())
 
         #configure the remote repository to be origin for new git repo
         self._repo = Git(self.getPath(), clone=remote)
 
         #update meta's remote url
-        self.setMeta('remote', self._repo.getRemoteURL())
+        self.setMeta('remote', self.getRepo().getRemoteURL())
 
         #print(self.getMeta(every=True))
         #save all changes to meta
         self.save(force=True)
 
         #commit all file changes
-        self._repo.add('.')
-        self._repo.commit('Creates legohdl block')
+        self.getRepo().add('.')
+        self.getRepo().commit('Creates legohdl block')
 
         #push to remote repository
-        self._repo.push()
+        self.getRepo().push()
 
         #display to user where the block is located
         log.info("Block "+self.getFull()+" found at: "+self.getPath())
@@ -1408,8 +1536,7 @@ class Block:
             return False
 
         #make sure Block.cfg files do not exist beyond the current directory
-        md_files = glob.glob(self.getPath()+"**/"+apt.MARKER, recursive=True)
-        if(len(md_files) > 0 and self.isValid() == False):
+        if(self.isValid() == False and self.hasSubBlocks()):
             log.error("Cannot initialize a block when sub-directories are blocks.")
             return False
 
@@ -1420,16 +1547,16 @@ class Block:
             #check if trying to configure remote (must be empty)
             if(remote != None):
                 if(Git.isBlankRepo(remote)):
-                    success = self._repo.setRemoteURL(remote)
+                    success = self.getRepo().setRemoteURL(remote)
                     #update metadata if successfully set the url
                     if(success):
                         self.setMeta("remote",remote)
-                        self._repo.push()
+                        self.getRepo().push()
                 elif(remote == ''):
                     #clear the remote
-                    self._repo.setRemoteURL('', force=True)
+                    self.getRepo().setRemoteURL('', force=True)
                     #update metadata if successfully cleared the url
-                    self.setMeta("remote", self._repo.getRemoteURL())
+                    self.setMeta("remote", self.getRepo().getRemoteURL())
                 else:
                     log.error("Cannot set existing block to a non-empty remote.")
                     return False
@@ -1491,14 +1618,14 @@ class Block:
         if(remote != None and already_valid == False):
             #set the remote URL
             if(fork == False):
-                self._repo.setRemoteURL(remote)
+                self.getRepo().setRemoteURL(remote)
                 #update metadata if successfully set the url
-                self.setMeta("remote", self._repo.getRemoteURL())
+                self.setMeta("remote", self.getRepo().getRemoteURL())
             #clear the remote url from this repository
             else:
-                self._repo.setRemoteURL('', force=True)
+                self.getRepo().setRemoteURL('', force=True)
                 #update metadata if successfully cleared the url
-                self.setMeta("remote", self._repo.getRemoteURL())
+                self.setMeta("remote", self.getRepo().getRemoteURL())
                 pass
 
         #check if trying to configure the summary
@@ -1511,9 +1638,9 @@ class Block:
         if(already_valid == False):
             if(hasattr(self, "_repo") == False):
                 self._repo = Git(self.getPath())
-            self._repo.add('.')
-            self._repo.commit('Initializes legohdl block')
-            self._repo.push()
+            self.getRepo().add('.')
+            self.getRepo().commit('Initializes legohdl block')
+            self.getRepo().push()
 
         #operation was successful
         return True
@@ -1538,21 +1665,24 @@ class Block:
         placeholders = self.getPlaceholders(template_val)
 
         #go through file and update with special placeholders
-        fdata = []
         with open(path, 'r') as rf:
-            lines = rf.readlines()
-            for l in lines:
-                for ph in placeholders:
-                    #print(ph[0], ph[1])
-                    l = l.replace(ph[0], ph[1])
-                fdata.append(l)
+            data = rf.read()
             rf.close()
+        fdata = data
+        #replace across the whole file at once (in order, so values may chain)
+        for ph in placeholders:
+            if(ph[0] in fdata):
+                fdata = fdata.replace(ph[0], ph[1])
         
-        #write new lines
-        with open(path, 'w') as wf:
-            for line in fdata:
-                wf.write(line)
-            wf.close()
+        #write new data only if a placeholder was found
+        if(fdata != data):
+            #write to a sibling file and swap it in to never leave a partial file
+            tmp_path = path+'.tmp'
+            with open(tmp_path, 'w') as wf:
+                wf.write(fdata)
+                wf.close()
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
 
         #replace all file name if contains the word 'TEMPLATE'
         #get the file name
@@ -1614,9 +1744,18 @@ class Block:
             return self._meta.get(sect, dtype=Section)
 
         #auto-cast requirements to list
-        dtype = list if(sect == 'block' and (key == 'requires' or key == 'vhdl-units' or key == 'vlog-units' or key == 'versions')) else str
+        if(sect == 'block' and key in Block.LIST_KEYS):
+            raw = self._meta.get(sect+'.'+key)
+            if(raw == None):
+                return None
+            #reuse the previously split list while the stored value is unchanged
+            if(hasattr(self, '_meta_lists') == False):
+                self._meta_lists = dict()
+            if(key not in self._meta_lists.keys() or self._meta_lists[key][0] != raw):
+                self._meta_lists[key] = (raw, Cfg.castList(raw))
+            return list(self._meta_lists[key][1])
         #access the key
-        return self._meta.get(sect+'.'+key, dtype=dtype)
+        return self._meta.get(sect+'.'+key)
 
 
     def setMeta(self, key, value, sect='block'):
@@ -1640,9 +1779,37 @@ class Block:
         return os.path.isfile(self.getMetaFile())
 
 
+    def hasSubBlocks(self):
+        '''
+        Returns true if a block marker file exists in any (non-hidden) directory
+        beneath the block's path. Stops walking at the first marker found.
+
+        Parameters:
+            None
+        Returns:
+            (bool): if a sub-directory is a block
+        '''
+        dirs = [self.getPath()] if(os.path.isdir(self.getPath())) else []
+        while(len(dirs)):
+            with os.scandir(dirs.pop()) as entries:
+                for e in entries:
+                    #skip hidden files and directories (.git, etc.)
+                    if(e.name.startswith('.')):
+                        continue
+                    if(e.name == apt.MARKER and e.is_file() and e.path != self.getMetaFile()):
+                        return True
+                    elif(e.is_dir(follow_symlinks=False)):
+                        dirs.append(e.path)
+                    pass
+            pass
+        return False
+
+
     def getMetaFile(self):
-        '''Return the path to the marker file.'''
-        return self.getPath()+apt.MARKER
+        '''Return the path to the marker file. Dynamically creates _meta_file attr.'''
+        if(hasattr(self, "_meta_file") == False):
+            self._meta_file = self.getPath()+apt.MARKER
+        return self._meta_file
 
     
     def getRequiresCode(self):
@@ -1652,9 +1819,8 @@ class Block:
         elif(self.getLvl() == Block.Level.INSTL):
             return 'latest'
         elif(self.getLvl() == Block.Level.VER):
-            #extract partial version
-            path,partial = os.path.split(self.getPath()[:len(self.getPath())-1])
-            return partial
+            #extract partial version (the folder name without its trailing '/')
+            return os.path.basename(self.getPath()[:-1])
         else:
             return 'v'+self.getVersion()
 
@@ -1668,20 +1834,40 @@ class Block:
         Returns:
             ([(str, str)]): placeholders and their respective values in tuples
         '''
-        #determine the date
-        today = date.today().strftime("%B %d, %Y")
-
-        phs = [
-            ("TEMPLATE", tmp_val), \
-            ("%DATE%", today), \
-            ("%AUTHOR%",  apt.getAuthor())
-        ]
+        static_phs = Block.getStaticPlaceholders()
+        #date and author come first, followed by any custom placeholders
+        phs = [("TEMPLATE", tmp_val)] + static_phs[:2]
 
         if(hasattr(self, "_meta")):
             phs += [
                 ("%BLOCK%", self.getFull())
             ]
 
+        phs += static_phs[2:]
+        #print(phs)
+        return phs
+
+
+    @classmethod
+    def getStaticPlaceholders(cls):
+        '''
+        Returns the placeholders that do not depend on a block: the date,
+        author, and custom placeholders from settings. Computed once per day
+        until clearPlaceholders() is called.
+
+        Parameters:
+            None
+        Returns:
+            ([(str, str)]): placeholders and their respective values in tuples
+        '''
+        today = date.today()
+        if(cls._StaticPlaceholders != None and cls._StaticPlaceholders[0] == today):
+            return list(cls._StaticPlaceholders[1])
+
+        phs = [
+            ("%DATE%", today.strftime("%B %d, %Y")), \
+            ("%AUTHOR%",  apt.getAuthor())
+        ]
         #get placeholders from settings (one-level section)
         custom_phs = apt.CFG.get('placeholders', dtype=Section)
         for ph in custom_phs.values():
@@ -1689,10 +1875,52 @@ class Block:
             ph._name = ph._name.replace('%','')
             #add to list of placeholders
             phs += [('%'+ph._name.upper()+'%', ph._val)]
-        #print(phs)
+
+        cls._StaticPlaceholders = (today, tuple(phs))
         return phs
 
 
+    @classmethod
+    def getStyling(cls):
+        '''
+        Returns the 'HDL-styling' settings cast to their datatypes. Read once
+        from the config until clearPlaceholders() is called.
+
+        Parameters:
+            None
+        Returns:
+            (dict): setting names and their casted values
+        '''
+        if(cls._Styling == None):
+            cls._Styling = {
+                'default-language' : apt.CFG.get('HDL-styling.default-language'),
+                'hanging-end' : apt.CFG.get('HDL-styling.hanging-end', dtype=bool),
+                'auto-fit' : apt.CFG.get('HDL-styling.auto-fit', dtype=bool),
+                'alignment' : apt.CFG.get('HDL-styling.alignment', dtype=int),
+                'newline-maps' : apt.CFG.get('HDL-styling.newline-maps', dtype=int),
+                'instance-name' : apt.CFG.get('HDL-styling.instance-name'),
+                'generic-modifier' : apt.CFG.get('HDL-styling.generic-modifier'),
+                'port-modifier' : apt.CFG.get('HDL-styling.port-modifier')
+            }
+        return cls._Styling
+
+
+    @classmethod
+    def clearPlaceholders(cls):
+        '''
+        Forget the computed static placeholders and HDL styling so the next
+        call re-reads the settings. Call after the settings are modified.
+
+        Parameters:
+            None
+        Returns:
+            None
+        '''
+        cls._StaticPlaceholders = None
+        cls._Styling = None
+        pass
+
+
     def openInEditor(self):
         '''Opens this block with the configured text-editor.'''
         log.info("Opening "+self.getTitle_old()+" at... "+self.getPath())
@@ -1718,9 +1946,11 @@ class Block:
         if(self.isValid() == False):
             corrupt = True
         else:
+            #snapshot the block section's keys once for the checks below
+            block_keys = set(self._meta.get('block', dtype=Section).keys())
             #check all required fields are in metadata
             for f in Block.REQ_KEYS:
-                if(f not in self._meta.get('block', dtype=Section).keys()):
+                if(f not in block_keys):
                     log.error("Missing required metadata key: "+f)
                     corrupt = True
                     break
@@ -1740,24 +1970,27 @@ class Block:
         return corrupt
 
 
-    def installReqs(self, tracking=[]):
+    def installReqs(self, tracking=None):
         '''
         Recursive method to install all required blocks.
 
         Parameters:
-            tracking ([string]): list of already installed requirements
+            tracking ({string}): set of already installed requirements (lower-case)
         Returns:
             None
         '''
+        if(tracking == None):
+            tracking = set()
         if(len(tracking) == 0):
             log.info("Collecting requirements...")
 
         for title in self.getMeta('requires'):
             #skip blocks already identified for installation
-            if(title.lower() in tracking):
+            title_low = title.lower()
+            if(title_low in tracking):
                 continue
             #update what blocks have been identified for installation
-            tracking += [title.lower()]
+            tracking.add(title_low)
 
             #break titles into discrete sections
             #print(title)
@@ -1856,7 +2089,7 @@ class Block:
                 return None
             
             #checkout from latest legohdl version tag (highest version number)
-            tmp_block._repo.git('checkout','tags/'+latest_ver+apt.TAG_ID)
+            tmp_block.getRepo().git('checkout','tags/'+latest_ver+apt.TAG_ID)
 
             #make sure block's state is not corrupted
             if(tmp_block.isCorrupt(latest_ver)):
@@ -1952,7 +2185,7 @@ class Block:
         Unit.resetJar()
 
         parts = ver.split('.')
-        sub_ver = apt.listToStr(parts[:places], delim='.')
+        sub_ver = '.'.join(parts[:places])
         #print(sub_ver)
 
         #check if the sub version is already installed
@@ -1975,19 +2208,21 @@ class Block:
         #create cache directory based on this block's path
         cache_path = self.getPath()+'../'+sub_ver+'/'
 
-        #checkout the correct version
-        self._repo.git('checkout','tags/'+ver+apt.TAG_ID)
-
-        #copy in all files from self
-        shutil.copytree(self.getPath(), cache_path)
+        #write the version's files straight from the repository's object database
+        #into the new location (leaves this block's working tree and index untouched)
+        os.makedirs(cache_path, exist_ok=True)
+        if(self.restoreVersion(ver, cache_path, partial=(places < 3)) == False):
+            #checkout the version and copy its files instead
+            self.copyVersion(ver, cache_path)
 
         #delete all files not ending in a supported source code extensions if
         #its a partial version (places < 3)
         if(places < 3):
-            all_files = glob.glob(cache_path+"**/*", recursive=True)
-            for f in all_files:
-                if(os.path.isfile(f) == False):
+            all_files = [e for e in Block.walkEntries(cache_path) if(e.name[0] != '.')]
+            for e in all_files:
+                if(e.is_file() == False):
                     continue
+                f = e.path
                 #get file extension
                 _,ext = os.path.splitext(f)
                 #get file name (+ extension)
@@ -1996,22 +2231,22 @@ class Block:
                 if(fname == 'Block.cfg'):
                     continue
                 #check if extension is one of supported HDL source codes
-                if('*'+ext.lower() not in apt.SRC_CODE):
-                    os.remove(f)
+                if(ext.lower() not in apt.SRC_EXTS):
+                    #may already be gone when reached twice through a linked directory
+                    try:
+                        os.remove(f)
+                    except FileNotFoundError:
+                        pass
 
-        #delete specific version's git repository data
-        repo = Git(cache_path)
-        repo.delete()
-        
         #create new block object as a specific version in the cache
         b = Block(cache_path, ws=self.getWorkspace(), lvl=Block.Level.VER)
-
-        #revert last checkout to latest version
-        self._repo.git('checkout','-')
+        #the set of installed versions has changed
+        self.clearInstalls()
 
         #make sure block's state is not corrupted
         if(b.isCorrupt(ver)):
             shutil.rmtree(cache_path, onerror=apt.rmReadOnly)
+            self.clearInstalls()
             return None
 
         #get all unit names
@@ -2060,6 +2295,108 @@ class Block:
         return b
 
     
+    def restoreVersion(self, ver, dest, partial=False):
+        '''
+        Writes the files of version ver from the repository into dest with 'git
+        restore', leaving this block's working tree and index untouched. A partial
+        version only gets the files that survive its pruning when decidable.
+
+        Returns False if the installed git is too old or the restore failed.
+
+        Parameters:
+            ver (str): proper version format (v0.0.0)
+            dest (str): directory to write the files into
+            partial (bool): determine if only writing a partial version's files
+        Returns:
+            (bool): determine if the files were written
+        '''
+        if(Git.getVersion() < Git.RESTORE_VER):
+            return False
+        tag = 'tags/'+ver+apt.TAG_ID
+        #only write out the files that survive the pruning (None if undecidable),
+        #which requires passing the paths through a file
+        keep_paths = None
+        if(partial and Git.getVersion() >= Git.PATHSPEC_FILE_VER):
+            keep_paths = self.getPartialPaths(ver)
+        if(keep_paths != None):
+            if(len(keep_paths) == 0):
+                return True
+            fd,spec_file = tempfile.mkstemp()
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                    f.write('\0'.join(keep_paths))
+                _,err,rc = self.getRepo().git('--literal-pathspecs', '--work-tree='+dest, 'restore', '--source='+tag, \
+                    '--worktree', '--pathspec-from-file='+spec_file, '--pathspec-file-nul', returncode=True)
+            finally:
+                os.remove(spec_file)
+        else:
+            _,err,rc = self.getRepo().git('--work-tree='+dest, 'restore', '--source='+tag, '--worktree', '--', '.', returncode=True)
+        if(rc != 0):
+            log.error("Failed to restore version "+ver+" of block "+self.getFull()+": "+err)
+            return False
+        #git may still report notices (line endings, attributes) on success
+        if(len(err)):
+            log.debug(err)
+        return True
+
+
+    def copyVersion(self, ver, dest):
+        '''
+        Checks out version ver in the repository to copy its files into dest,
+        then switches the repository back. Used when 'git restore' is unavailable.
+
+        Parameters:
+            ver (str): proper version format (v0.0.0)
+            dest (str): directory to write the files into (replaced if exists)
+        Returns:
+            None
+        '''
+        #checkout the correct version
+        self.getRepo().git('checkout','tags/'+ver+apt.TAG_ID)
+
+        #copy in all files from self
+        if(os.path.exists(dest)):
+            shutil.rmtree(dest, onerror=apt.rmReadOnly)
+        shutil.copytree(self.getPath(), dest)
+
+        #delete specific version's git repository data
+        repo = Git(dest)
+        repo.delete()
+
+        #revert last checkout to latest version
+        self.getRepo().git('checkout','-')
+        pass
+
+
+    def getPartialPaths(self, ver):
+        '''
+        Lists the repository paths at version ver that a partial version keeps
+        after pruning: supported HDL source files, Block.cfg files, and anything
+        hidden. Returns None if the tree has symbolic links, since whether those
+        survive depends on their targets being written out too.
+
+        Parameters:
+            ver (str): proper version format (v0.0.0)
+        Returns:
+            ([str]): paths relative to the repository root
+        '''
+        tree,_ = self.getRepo().git('ls-tree', '-r', '-z', '--full-tree', 'tags/'+ver+apt.TAG_ID)
+        keep_paths = []
+        for entry in tree.split('\0'):
+            if(len(entry) == 0):
+                continue
+            #format: <mode> SP <type> SP <object> TAB <path>
+            info,path = entry.split('\t', 1)
+            if(info.startswith('120000')):
+                return None
+            fname = path[path.rfind('/')+1:]
+            _,ext = os.path.splitext(fname)
+            if(fname == 'Block.cfg' or ext.lower() in apt.SRC_EXTS or path[0] == '.' or path.count('/.')):
+                keep_paths += [path]
+            pass
+        return keep_paths
+
+
     def uninstall(self, ver):
         '''
         Uninstall the given block from the cache using its INSTL status block.
@@ -2106,7 +2443,8 @@ class Block:
                 return False
         #includes latest and everything else
         else:
-            uninstallations = installations
+            #copy so the installer's cached map does not gain a 'latest' entry
+            uninstallations = Map(installations)
             uninstallations['latest'] = instl
 
         #display helpful information to user about what installations will be deleted
@@ -2128,6 +2466,8 @@ class Block:
             i.delete()
             #:todo: make sure to see if a partial version needs updating (either removed or different version holds it)
             pass
+        #the set of installed versions has changed
+        instl.clearInstalls()
 
         #remove this block's cache path name if uninstalling the main cache block
         if(instl in uninstallations.values()):
@@ -2157,6 +2497,42 @@ class Block:
         return True
 
 
+    @classmethod
+    def walkEntries(cls, path):
+        '''
+        Collects the entries of every visible directory at or below path with
+        a single scan. Directories are visited in the same pre-order as a
+        recursive glob.glob() and each directory's entries are kept in listing
+        order. Hidden directories are not entered (hidden files within visible
+        directories are still returned) and unreadable directories are skipped.
+
+        Parameters:
+            path (str): directory to begin the scan
+        Returns:
+            ([os.DirEntry]): entries found with paths formatted like glob's
+        '''
+        #drop trailing separators like glob does for the directory part
+        root = os.path.dirname(os.path.join(path, '_'))
+        entries = []
+        dirs = [root]
+        while(len(dirs)):
+            try:
+                with os.scandir(dirs.pop()) as it:
+                    found = list(it)
+            except OSError:
+                continue
+            entries += found
+            #push visible sub-directories in reverse to pop them in listing order
+            for e in reversed(found):
+                try:
+                    if(e.name[0] != '.' and e.is_dir()):
+                        dirs.append(e.path)
+                except OSError:
+                    pass
+            pass
+        return entries
+
+
     def modWritePermissions(self, enable, path=None):
         '''
         Disable modification/write permissions of all files specified on this
@@ -2173,19 +2549,22 @@ class Block:
         if(path == None):
             path = self.getPath()
         
-        all_files = glob.glob(path+"**/*.*", recursive=True)
+        #visible files/directories with an extension
+        all_files = [e for e in Block.walkEntries(path) if(e.name[0] != '.' and '.' in e.name)]
 
-        for f in all_files:
+        for e in all_files:
             #get current file permissions
-            cur_permissions = stat.S_IMODE(os.lstat(f).st_mode)
+            cur_permissions = stat.S_IMODE(e.stat(follow_symlinks=False).st_mode)
             if(enable):
-                #get write masks and OR with current permissions
-                w_permissions = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
-                os.chmod(f, cur_permissions | w_permissions)
+                #OR write masks with current permissions
+                new_permissions = cur_permissions | Block.WRITE_MASK
             else:
-                #flip write masks and AND with current permissions
-                w_permissions = ~stat.S_IWUSR & ~stat.S_IWGRP & ~stat.S_IWOTH
-                os.chmod(f, cur_permissions & w_permissions)
+                #AND flipped write masks with current permissions
+                new_permissions = cur_permissions & ~Block.WRITE_MASK
+            #skip files already in the requested state (links always pass through to their target)
+            if(new_permissions == cur_permissions and e.is_symlink() == False):
+                continue
+            os.chmod(e.path, new_permissions)
             pass
         pass
 
@@ -2215,17 +2594,20 @@ class Block:
         for u in units.values():
             direct_reqs += u.getReqs()
 
-        #for each direct required unit, add its block
+        #for each direct required unit, add its block (blocks compare by identity)
+        seen = set()
         for dr in direct_reqs:
-            if(dr.getLanguageFile().getOwner() not in block_reqs):
-                block_reqs += [dr.getLanguageFile().getOwner()]
+            owner = dr.getLanguageFile().getOwner()
+            if(id(owner) not in seen):
+                seen.add(id(owner))
+                block_reqs += [owner]
         #print(block_reqs)
-        #store block titles in a map to compare without case sense
-        block_titles = Map()
+        #store block titles under lower-case keys to compare without case sense
+        block_titles = dict()
 
-        block_requires = Map()
+        block_requires = dict()
         for bd in self.getMeta('requires'):
-            block_requires[bd] = bd
+            block_requires[bd.lower()] = bd
 
         #iterate through every block requirement to add its title
         for b in block_reqs:
@@ -2234,35 +2616,21 @@ class Block:
                 continue
             #add how it was used (latest, unstable, v1, etc.)
             #print(b.getRequiresCode())
-            if(b.getFull(inc_ver=True).lower() not in block_titles.keys()):
-                block_titles[b.getFull(inc_ver=True)] = [b, []]
-            block_titles[b.getFull(inc_ver=True)][1] += [b.getRequiresCode()]
+            title = b.getFull(inc_ver=True).lower()
+            if(title not in block_titles.keys()):
+                block_titles[title] = [b, []]
+            block_titles[title][1] += [b.getRequiresCode()]
             pass
 
         #formulate each block identifier into a complete str
-        block_ids = Map()
+        block_ids = dict()
         for b,parts in block_titles.items():
             b_obj = parts[0]
             identifier = b_obj.getFull(inc_ver=True, vers=parts[1])
-            block_ids[identifier] = identifier
-
-        update = False
-        
-        #update if the length of the dependencies has changed
-        if(len(block_requires) != len(block_ids)):
-            update = True
-
-        #iterate through every already-listed block derivative
-        for b in block_requires.keys():
-            if(b not in block_ids.keys()):
-                update = True
-                break
+            block_ids[identifier.lower()] = identifier
 
-        #iterate through every found block requirement
-        for b in block_ids.keys():
-            if(b not in block_requires.keys()):
-                update = True
-                break
+        #update if any dependency was added or removed (keys are case-insensitive)
+        update = (block_requires.keys() != block_ids.keys())
 
         #update the metadata for requirements
         if(update and dry_run == False):
@@ -2300,13 +2668,24 @@ class Block:
         srcs = []
         #ignores build folder with filter
         bd = apt.getBuildDirectory()
-        #automatically does case insensitivity on glob for windows os
+        #scan the directory tree once and match every extension against it
+        entries = None
+        #automatically does case insensitivity on fnmatch for windows os
         for e in ext:
-            srcs = srcs + glob.glob(path+"/**/"+e, recursive=True)
+            #patterns spanning directories (or without wildcards) are left to glob
+            if(e.count('/') or e.count(os.sep) or glob.has_magic(e) == False):
+                srcs = srcs + glob.glob(path+"/**/"+e, recursive=True)
+                continue
+            if(entries == None):
+                entries = Block.walkEntries(path)
+            #hidden files only match patterns that are also hidden
+            show_hidden = (e[0] == '.')
+            srcs = srcs + [f.path for f in entries if((show_hidden or f.name[0] != '.') and fnmatch.fnmatch(f.name, e))]
             pass
 
         #omit build/ files
-        srcs = list(filter(lambda p : apt.fs(p).count(path+bd) == 0, srcs))
+        bd_path = path+bd
+        srcs = [p for p in srcs if(bd_path not in apt.fs(p))]
         #print(srcs)
 
         return srcs
@@ -2332,6 +2711,10 @@ class Block:
             if(inc_ent):
                 return '','','','','' #return 5 blanks
             return '','','','' #return 4 blanks
+        #return the previously split title (entity delimiter is part of the key)
+        key = (title, inc_ent, delim, apt.ENTITY_DELIM)
+        if(key in cls._TitleParts.keys()):
+            return cls._TitleParts[key]
         V = ''
         #:todo: will not work if (v1.0.0):adder (version and entity together)
         #find version label if possible
@@ -2340,12 +2723,9 @@ class Block:
             V = cls.stdVer(title[v_index+1:-1])
             title = title[:v_index]
 
-        #split into pieces
-        pieces = title.split(delim)
-        sects = ['']*3
-        diff = 3 - len(pieces)
-        for i in range(len(pieces)-1, -1, -1):
-            sects[diff+i] = pieces[i]
+        #split into at most 3 pieces from the right and left-pad missing parts
+        pieces = title.rsplit(delim, 2)
+        sects = ['']*(3-len(pieces)) + pieces
         #check final piece if it has an entity attached
         entity = ''
         if(sects[2].count(apt.ENTITY_DELIM)):
@@ -2357,9 +2737,14 @@ class Block:
             entity = sects[2]
             sects[2] = ''
         if(inc_ent):
-            return sects[0],sects[1],sects[2],V,entity
-
-        return sects[0],sects[1],sects[2],V
+            parts = (sects[0],sects[1],sects[2],V,entity)
+        else:
+            parts = (sects[0],sects[1],sects[2],V)
+        #bound the container so arbitrary user input cannot grow it forever
+        if(len(cls._TitleParts) >= 4096):
+            cls._TitleParts.clear()
+        cls._TitleParts[key] = parts
+        return parts
 
 
     def identifyTop(self, verbose=True):
@@ -2378,19 +2763,18 @@ class Block:
         self._top = None
         #constrain to only current block's units and fill out data on each unit
         units = self.getUnits(recursive=False)
-        #get the names of each unit available
-        top_contenders = list(units.keys())
+        #collect the names of units that cannot be the top-level
+        eliminated = set()
         #iterate through each unit and eliminate unlikely top-levels
         for name,unit in units.items():
             #if the entity is value under this key, it is lower-level
             if(unit.isTb() or unit.isPkg()):
-                if(name in top_contenders):
-                    top_contenders.remove(name)
+                eliminated.add(name)
                 continue
                 
-            for dep in unit.getReqs():
-                if(dep.E().lower() in top_contenders):
-                    top_contenders.remove(dep.E().lower())
+            eliminated.update([dep.E().lower() for dep in unit.getReqs()])
+        #keep the remaining unit names in their original order
+        top_contenders = [name for name in units.keys() if(name not in eliminated)]
 
         if(len(top_contenders) == 0):
             if(verbose):
@@ -2439,19 +2823,20 @@ class Block:
         units = self.getUnits(recursive=False)            
 
         benches = []
-        #iterate through each available unit and eliminate it
-        for unit in units.values():
-            for dep in unit.getReqs():
-                if(dep.E().lower() == entity_name and unit.isTb()):
-                    benches.append(unit)
-            pass
-
         #try to find explicit testbench
         if(expl != None):
-            benches = []
             if(expl.lower() in units.keys()):
                 benches = [units[expl]]
             pass             
+        #iterate through each available testbench and eliminate it
+        else:
+            for unit in units.values():
+                if(unit.isTb() == False):
+                    continue
+                for dep in unit.getReqs():
+                    if(dep.E().lower() == entity_name):
+                        benches.append(unit)
+                pass
 
         #perfect; only 1 was found  
         if(len(benches) == 1):
@@ -2559,12 +2944,19 @@ class Block:
             (str): formatted block identifier
         '''
         # :todo: store MLNV as tuple and use single function for full-access
-        title = ''
-        #prepend vendor if not blank
-        if(self.M() != ''):
-            title = self.M()+'.'
-        #join together library and name
-        title = title+self.L()+'.'+self.N()
+        #reuse a title already formatted for the same arguments
+        if(hasattr(self, "_full_titles") == False):
+            self._full_titles = dict()
+        key = (inc_ver, tuple(vers)) if(inc_ver) else False
+        if(key in self._full_titles.keys()):
+            return self._full_titles[key]
+        #read the vendor once, it decides the title's leading part
+        M = self.M()
+        #join together library and name, prepending vendor if not blank
+        if(M != ''):
+            title = M+'.'+self.L()+'.'+self.N()
+        else:
+            title = self.L()+'.'+self.N()
         #append version if requested
         if(inc_ver):
             #describe which versions were based from specific version
@@ -2577,6 +2969,7 @@ class Block:
             # if(vers = [self.V()]):
             #     v_chain = self.V()
             title = title+"("+v_chain+")"
+        self._full_titles[key] = title
         return title
 
 
@@ -2669,25 +3062,7 @@ class Block:
                 return unit_names
 
         if(hasattr(self, "_units")):
-            if(lang != ''):
-                #filter between vhdl or verilog units
-                tmp_fltr = []
-                if(lang.lower() == 'vhdl'):
-                    tmp_fltr = list(filter(lambda a: a[1].getLang() == Unit.Language.VHDL, self._units.items()))
-                elif(lang.lower() == 'vlog'):
-                    tmp_fltr = list(filter(lambda a: a[1].getLang() == Unit.Language.VERILOG, self._units.items()))
-                #compile into a Map
-                tmp = Map()
-                for u in tmp_fltr:
-                    tmp[u[0]] = u[1]
-                #only return the keys (names)
-                if(returnnames):
-                    tmp = [u.E() for u in tmp.values()]
-                return tmp
-
-            if(returnnames):
-                return [u.E() for u in self._units.values()]
-            return self._units
+            return self._filterUnits(returnnames, lang)
 
         self._hdl_files = []
         #open each found source file and identify their units
@@ -2706,25 +3081,36 @@ class Block:
         else:
             self._units = Map()
 
-        if(lang != ''):
-            #filter between vhdl or verilog units
-            tmp_fltr = []
-            if(lang.lower() == 'vhdl'):
-                tmp_fltr = list(filter(lambda a: a[1].getLang() == Unit.Language.VHDL, self._units.items()))
-            elif(lang.lower() == 'vlog'):
-                tmp_fltr = list(filter(lambda a: a[1].getLang() == Unit.Language.VERILOG, self._units.items()))
-            #compile into a Map
-            tmp = Map()
-            for u in tmp_fltr:
-                tmp[u[0]] = u[1]
-            #only return the keys (names)
+        return self._filterUnits(returnnames, lang)
+
+
+    def _filterUnits(self, returnnames, lang):
+        '''
+        Returns the loaded _units attr, optionally narrowed to one coding
+        language and/or reduced to the unit names.
+
+        Parameters:
+            returnnames (bool): determine if to return list of names
+            lang (str): filter based on HDL coding language ('vhdl' or 'vlog')
+        Returns:
+            (Map) or ([str]): matching units or their names
+        '''
+        if(lang == ''):
             if(returnnames):
                 return [u.E() for u in self._units.values()]
-            return tmp
-            
+            return self._units
+
+        #filter between vhdl or verilog units (unknown languages match nothing)
+        target = None
+        if(lang.lower() == 'vhdl'):
+            target = Unit.Language.VHDL
+        elif(lang.lower() == 'vlog'):
+            target = Unit.Language.VERILOG
+        #only return the names
         if(returnnames):
-            return [u.E() for u in self._units.values()]
-        return self._units
+            return [u.E() for u in self._units.values() if(u.getLang() is target)]
+        #compile into a Map
+        return Map({k : u for k,u in self._units.items() if(u.getLang() is target)})
 
     
     def getUnits(self, top=None, recursive=True):
@@ -2745,7 +3131,8 @@ class Block:
         '''
         units = self.loadHDL()
 
-        if(top != None and top in units.values()):
+        #units are stored under their entity name, so look the top up directly
+        if(top != None and units.get(top.E()) is top):
             if(top.isChecked() == False):
                 top.getLanguageFile().decode(top, recursive)
         else:
@@ -2763,19 +3150,25 @@ class Block:
 
     @classmethod
     def getAllBlocks(cls):
-        '''Returns _all_blocks ([Block]) attr of every block in valid level.'''
-        if(hasattr(cls, '_all_blocks')):
-            return cls._all_blocks
-        cls._all_blocks = []
-        for vndrs in cls.Inventory.values():
-            for libs in vndrs.values():
-                for blks in libs.values():
-                    for lvl in blks:
-                        if(lvl != None):
-                            cls._all_blocks += [lvl]
-                            break
-                        pass
-        return cls._all_blocks
+        '''
+        Returns the first existing level's block for every M.L.N in the Inventory.
+        The list is rebuilt only after the Inventory has been modified.
+
+        Parameters:
+            None
+        Returns:
+            ([Block]): the lowest-level block of every block in the Inventory
+        '''
+        if(cls._AllBlocks != None and cls._AllBlocks[0] == cls._InvVersion):
+            return cls._AllBlocks[1]
+        #take each block's first level that is not empty
+        firsts = (next((lvl for lvl in blks if(lvl != None)), None) \
+            for vndrs in cls.Inventory.values() \
+                for libs in vndrs.values() \
+                    for blks in libs.values())
+        all_blocks = [b for b in firsts if(b != None)]
+        cls._AllBlocks = (cls._InvVersion, all_blocks)
+        return all_blocks
 
 
     def get(self, entity, no_about, list_arch, inst, comp, lang, edges):
@@ -2801,7 +3194,8 @@ class Block:
             log.error("Entity "+entity+" not found in block "+self.getFull()+"!")
             return False
 
-        def_lang = apt.CFG.get('HDL-styling.default-language').lower()
+        styling = Block.getStyling()
+        def_lang = styling['default-language'].lower()
 
         #determine the language for outputting compatible code
         if(lang != None):
@@ -2821,14 +3215,14 @@ class Block:
         #grab the desired entity from the Map
         ent = units[entity]
 
-        hang_end = apt.CFG.get('HDL-styling.hanging-end', dtype=bool)
-        auto_fit = apt.CFG.get('HDL-styling.auto-fit', dtype=bool)
-        alignment = apt.CFG.get('HDL-styling.alignment', dtype=int)
-        maps_on_newline = apt.CFG.get('HDL-styling.newline-maps', dtype=int)
-        inst_name = apt.CFG.get('HDL-styling.instance-name')
+        hang_end = styling['hanging-end']
+        auto_fit = styling['auto-fit']
+        alignment = styling['alignment']
+        maps_on_newline = styling['newline-maps']
+        inst_name = styling['instance-name']
 
-        g_mod = apt.CFG.get('HDL-styling.generic-modifier')
-        p_mod = apt.CFG.get('HDL-styling.port-modifier')
+        g_mod = styling['generic-modifier']
+        p_mod = styling['port-modifier']
 
         #swap placeholders in inst name
         for ph in self.getPlaceholders(ent.E()):
@@ -2939,22 +3333,24 @@ class Block:
 
         #read the metadata by default
         info_txt = '--- METADATA ---\n'
-        in_sect = ''
-        in_key = ''
+        in_block = False
+        in_extra = False
         #open and dump the metadata contents into 'info_txt'
         with open(self.getMetaFile(), 'r') as file:
             for line in file:
+                stripped = line.strip()
                 #detect when entering a section
-                if(len(line) > 1 and line.strip()[0] == '[' and line.strip()[-1] == ']'):
-                    in_sect = line.strip()
+                if(len(stripped) > 1 and stripped.startswith('[') and stripped.endswith(']')):
+                    in_block = (stripped.lower() == '[block]')
                 #detect when finding a key
-                elif(line.count('=')):
-                    in_key = line[:line.find('=')].strip()
-                #print(in_header+'|'+in_key)
+                else:
+                    eq = line.find('=')
+                    if(eq > -1):
+                        in_extra = (line[:eq].strip().lower() in Block.EXTRA_KEYS)
                 #avoid printing extra keys in metadata section
-                if(in_sect.lower() == '[block]' and in_key.lower() in Block.EXTRA_KEYS):
+                if(in_block and in_extra):
                     #do not write to metadata section (but do write empty lines)
-                    if(len(line.strip()) > 0):
+                    if(len(stripped) > 0):
                         continue
                 info_txt = info_txt + line
 
@@ -3025,23 +3421,34 @@ class Block:
                 all_versions = self.sortVersions(list(set(all_versions)))
                 pass
 
+            #membership is tested once per version, so keep the installs in a set
+            instl_set = set(instl_versions)
+            #the latest version only counts as installed if listed more than once
+            latest_instld = (len(instl_versions) > 0 and instl_versions.count(instl_versions[0]) > 1)
+
+            #split the version range bounds only once
+            lo_key = Block.sepVer(ver_range[0])
+            hi_key = Block.sepVer(ver_range[1])
+
             #track what partial versions have been identified
-            logged_part_vers = []
+            logged_part_vers = set()
             #iterate through all versions
             for x in all_versions:
                 status = ''
                 partials = []
                 
                 #check if this specific version is installed to cache
-                if(x in instl_versions and \
-                    (x != instl_versions[0] or instl_versions.count(x) > 1)):
+                if(x in instl_set and (x != instl_versions[0] or latest_instld)):
                     status = '*'
                     #identify what version are partial versions (maj and min partials)
-                    for i in range(1,3):
-                        part_ver = apt.listToStr(x.split('.')[:i], delim='.')
-                        if(part_ver in instl_versions and part_ver not in logged_part_vers):
+                    first_dot = x.find('.')
+                    second_dot = x.find('.', first_dot+1) if(first_dot > -1) else -1
+                    maj = x[:first_dot] if(first_dot > -1) else x
+                    maj_min = x[:second_dot] if(second_dot > -1) else x
+                    for part_ver in (maj, maj_min):
+                        if(part_ver in instl_set and part_ver not in logged_part_vers):
                             partials += [part_ver]
-                            logged_part_vers.append(part_ver)
+                            logged_part_vers.add(part_ver)
                 
                 #latest is the highest version from instl_versions
                 if(len(instl_versions) and x == instl_versions[0]):
@@ -3056,7 +3463,8 @@ class Block:
                     continue
 
                 #constrain to version range
-                if(self.cmpVer(ver_range[0], x) == x and (ver_range[1] == '' or self.cmpVer(ver_range[1], x) == ver_range[1])):
+                x_key = Block.sepVer(x)
+                if(lo_key <= x_key and (ver_range[1] == '' or x_key < hi_key or x == ver_range[1])):
                     pass
                 #zoom to only singular version
                 elif(Block.stdVer(x, rm_v=True) == ver_range[0] and ver_range[1] == '-'):
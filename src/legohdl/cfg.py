@@ -7,6 +7,7 @@
 #   files used for settings and blocks.
 # ------------------------------------------------------------------------------
 
+import copy, hashlib
 from .map import Map
 
 
@@ -74,6 +75,9 @@ class Cfg:
     #instance checking
     SECT = (dict, Section)
 
+    #parsed file contents keyed by filepath -> (digest of file contents, data)
+    _Cache = dict()
+
 
     def __init__(self, filepath, data=Section(), comments=dict(), en_mult_lvl=True):
         '''
@@ -111,74 +115,124 @@ class Cfg:
         '''
         #make sure the file opens with no errors
         try:
-            open(self._filepath, 'r').close()
+            with open(self._filepath, 'r') as ini:
+                lines = ini.readlines()
         except:
             #no file exists so say it can be written
             self._modified = True
             return False
+
+        #reuse the previous parse if the file's contents have not changed since
+        #(timestamps can be too coarse to notice quick same-size edits or are kept by copies)
+        stamp = hashlib.sha1(''.join(lines).encode()).hexdigest()
+        if(self._filepath in Cfg._Cache.keys() and Cfg._Cache[self._filepath][0] == stamp):
+            self._overlay(Cfg._Cache[self._filepath][1])
+            return True
+
         in_str = ''
         next_in_str = ''
         prev_parents = []
+        #parse into a blank section to be overlayed onto the existing data
+        data = self._data
+        self._data = Section(name=data._name)
         #begin on entire data
         cur_sect = self._data
         cur_key = None
-        #open the file
-        with open(self._filepath, 'r') as ini:
-            lines = ini.readlines()
-            for l in lines:
-                in_str = next_in_str
-                #clean up any comments from the file line
-                l, next_in_str = self._trimComments(l, in_str=in_str, c_token=Cfg.CMT)
-                #trim off new lines and white space
-                l = l.strip()
-                #print(next_in_str)
-
-                #add newlines if empty line and within a key's value
-                if(len(in_str) and cur_key != None and len(l) == 0):
-                    cur_sect[cur_key]._val = cur_sect[cur_key]._val + '\n'
-
-                #skip empty lines
-                if(len(l) == 0):
-                    continue
-                
-                #check for section
-                new_sect, prev_parents, cur_sect = self._addSection(l, prev_parents, cur_sect)
+        #parse each line of the file
+        for l in lines:
+            in_str = next_in_str
+            #clean up any comments from the file line
+            l, next_in_str = self._trimComments(l, in_str=in_str, c_token=Cfg.CMT)
+            #trim off new lines and white space
+            l = l.strip()
+            #print(next_in_str)
+
+            #add newlines if empty line and within a key's value
+            if(len(in_str) and cur_key != None and len(l) == 0):
+                cur_sect[cur_key]._val = cur_sect[cur_key]._val + '\n'
+
+            #skip empty lines
+            if(len(l) == 0):
+                continue
+            
+            #check for section
+            new_sect, prev_parents, cur_sect = self._addSection(l, prev_parents, cur_sect)
+
+            if(new_sect):
+                #reset current key
+                cur_key = None
+                continue
+
+            #check for new keys (properties)
+            key_l,_ = self._trimComments(l, in_str=in_str, c_token=Cfg.KEY_ASSIGNMENT)
+            key_true = key_l.strip()
+            key_l = key_l.strip().lower()
+
+            #find first '='
+            v_i = l.find(Cfg.KEY_ASSIGNMENT)
+            
+            #skip if not in a valid key (must have a '=' on same line as key declaration)
+            if(len(key_l.split()) > 1 or key_l == Cfg.KEY_ASSIGNMENT or v_i <= 0):
+                #else update
+                if(cur_key != None):
+                    spacer = ' '
+                    #check what the previous status was
+                    if(len(in_str)):
+                        spacer = '\n'
+                    if(len(cur_sect[cur_key]._val) == 0):
+                        spacer = ''
+                    cur_sect[cur_key]._val = cur_sect[cur_key]._val + spacer + l.strip()
+                continue
+           
+            #assign to the key location in the data structure (and expand tabs)
+            cur_sect[key_l] = Key(key_true, l[v_i+1:].strip().replace('\t', Cfg.TAB))
+            #update which key is the current
+            cur_key = key_l
+
+            #print(l)
+        pass
 
-                if(new_sect):
-                    #reset current key
-                    cur_key = None
-                    continue
+        #store a copy of the parsed contents for later reads
+        parsed = self._data
+        self._data = data
+        Cfg._Cache[self._filepath] = (stamp, parsed)
+        self._overlay(parsed)
+        return True
 
-                #check for new keys (properties)
-                key_l,_ = self._trimComments(l, in_str=in_str, c_token=Cfg.KEY_ASSIGNMENT)
-                key_true = key_l.strip()
-                key_l = key_l.strip().lower()
 
-                #find first '='
-                v_i = l.find(Cfg.KEY_ASSIGNMENT)
-                
-                #skip if not in a valid key (must have a '=' on same line as key declaration)
-                if(len(key_l.split()) > 1 or key_l == Cfg.KEY_ASSIGNMENT or v_i <= 0):
-                    #else update
-                    if(cur_key != None):
-                        spacer = ' '
-                        #check what the previous status was
-                        if(len(in_str)):
-                            spacer = '\n'
-                        if(len(cur_sect[cur_key]._val) == 0):
-                            spacer = ''
-                        cur_sect[cur_key]._val = cur_sect[cur_key]._val + spacer + l.strip()
-                    continue
-               
-                #assign to the key location in the data structure (and expand tabs)
-                cur_sect[key_l] = Key(key_true, l[v_i+1:].strip().replace('\t', Cfg.TAB))
-                #update which key is the current
-                cur_key = key_l
+    def _overlay(self, parsed):
+        '''
+        Copies the top-level sections/keys of a parsed file onto the _data attr.
+        Sections found in the file overwrite any existing ones.
 
-                #print(l)
-            pass
+        Parameters:
+            parsed (Section): data structure read from the file
+        Returns:
+            None
+        '''
+        for k in parsed.keys():
+            self._data[k] = Cfg._clone(parsed[k])
+        pass
 
-        return True
+
+    @classmethod
+    def _clone(cls, node):
+        '''
+        Returns a new copy of a Section/Key. Sections are copied level by level
+        rather than through a generic deep copy.
+
+        Parameters:
+            node (Section/Key): data structure to copy
+        Returns:
+            (Section/Key): the copied data structure
+        '''
+        #copy a key's attrs as they are (its list state is not derived again)
+        if(isinstance(node, Section) == False):
+            return copy.copy(node)
+        cp = Section(name=node._name)
+        for k,v in node.items():
+            cp._inventory[k] = cls._clone(v)
+        return cp
 
 
     def write(self, auto_indent=True, neat_keys=True, empty=False):
@@ -196,7 +250,10 @@ class Cfg:
         Returns:
             None 
         '''
-        contents = self._writeComment('', Cfg.CMT+' ')
+        #collect pieces of text to be joined once when writing
+        contents = [self._writeComment('', Cfg.CMT+' ')]
+        #track if any text has been written yet
+        written = bool(len(contents[0]))
 
         #store nested sections
         nested_sects = [('', self._data, '', 0)] 
@@ -207,7 +264,8 @@ class Cfg:
             cmt, data, cur_key, lvl = nested_sects.pop()
             #print(cur_key)
             #write its comment
-            contents = contents + cmt
+            contents += [cmt]
+            written = written or bool(len(cmt))
 
             #compute longest key name
             keys = list(filter(lambda a: isinstance(data[a], Section) == False, list(data.keys())))
@@ -221,7 +279,7 @@ class Cfg:
             #track where to insert nested sections in stack
             nest_cnt = 0
             #enable when to write comments 'as section'
-            en_sect = bool(len(contents))
+            en_sect = written
 
             #iterate through every key in the section
             for sect in list(data.keys()):
@@ -255,8 +313,9 @@ class Cfg:
                     continue
 
                 #write the comment (will be blank if not found)
-                if(cmt != '\n' or contents != ''):
-                    contents = contents + cmt
+                if(cmt != '\n' or written):
+                    contents += [cmt]
+                    written = written or bool(len(cmt))
                 #will add a comment mark
                 c_mark = ''
                 if(empty):
@@ -277,12 +336,23 @@ class Cfg:
                 if(data[sect]._is_list or neat_keys == False):
                     spacer = 0
                 #write the value
-                contents = contents + self.writeWithRollOver(T+c_mark+key_var+val, newline=(' '*spacer)+c_mark) + '\n'
+                contents += [self.writeWithRollOver(T+c_mark+key_var+val, newline=(' '*spacer)+c_mark) + '\n']
+                written = True
                 pass
 
-        #write contents to file
-        with open(self._filepath, 'w') as ini:
-            ini.write(contents)
+        text = ''.join(contents)
+        #leave the file (and its cached parse) untouched if it already holds this text
+        try:
+            with open(self._filepath, 'r') as ini:
+                unchanged = (ini.read() == text)
+        except:
+            unchanged = False
+        if(unchanged == False):
+            #write contents to file
+            with open(self._filepath, 'w') as ini:
+                ini.write(text)
+            #invalidate any previous parse of this file
+            Cfg._Cache.pop(self._filepath, None)
 
         #return modified state to false
         self._modified = False
@@ -322,13 +392,7 @@ class Cfg:
         #if the end result is still a dictionary then return None
         if(isinstance(node, Section)):
             if(dtype == Section):
-                cp = Section(name=node._name)
-                for k in node.keys():
-                    if(isinstance(node[k], Section)):
-                        cp[k] = self.get(key+'.'+k, dtype=Section)
-                    else:
-                        cp[k] = self.get(key+'.'+k, dtype=Key)
-                return cp
+                return Cfg._clone(node)
             else:
                 return None
 
@@ -799,6 +863,13 @@ class Cfg:
             short_line (str): line without comments
             in_str (bool): if the next line will be within a string
         '''
+        #skip character scanning when no strings are involved in the line
+        if(len(in_str) == 0 and line.find('\'') == -1 and line.find('\"') == -1):
+            c = line.find(c_token)
+            if(c > -1):
+                line = line[:c]
+            return line, in_str
+
         #store where invalid comments are in the line
         invalid_comments = []
 
@@ -7,7 +7,7 @@
 #   repositories.
 # ------------------------------------------------------------------------------
 
-import os, shutil
+import os, shutil, re
 import logging as log
 
 from .apparatus import Apparatus as apt
@@ -19,8 +19,20 @@ class Git:
     #track all valid and invalid urls for faster performance (as well as if blank)
     _URLstatus = {}
 
+    #a remote url must have a scheme (https://, ssh://, etc.) or be scp-like ([user@]host:path)
+    URL_FORMAT = re.compile(r'^([a-zA-Z][\w+.-]*://|([\w.-]+@)?[\w.-]+:)')
+
     QUIET = True
 
+    #oldest git version providing 'restore' to write a tag's files elsewhere
+    RESTORE_VER = (2,23,0)
+
+    #oldest git version reading pathspecs from a file ('--pathspec-from-file')
+    PATHSPEC_FILE_VER = (2,26,0)
+
+    #installed git version as (major,minor,patch), determined on first use
+    _Version = None
+
     def __init__(self, path, clone=None, ensure_exists=True):
         '''
         Create a Git instance. This is a repository-like object. Will `init`
@@ -67,20 +79,22 @@ class Git:
         pass
 
 
-    def git(self, *args):
+    def git(self, *args, returncode=False):
         '''
         Use git executable with specified repository path.
 
         Parameters:
             *args (*str): arguments to be passed to git
+            returncode (bool): determine if to also return git's exit status
         Returns:
             output (str): stdout from the subprocess
             error (str): stderr from the subprocess
+            rc (int): exit status of git (only if `returncode` is true)
         '''
         #filter out blank arguments
         args = tuple(filter(lambda a: len(a), args))
-        resp,err = apt.execute('git', '-C', self.getPath(), *args, quiet=self.QUIET, returnoutput=True)
-        return resp,err
+        return apt.execute('git', '-C', self.getPath(), *args, quiet=self.QUIET, \
+            returnoutput=True, returncode=returncode)
 
 
     def commit(self, msg):
@@ -250,6 +264,10 @@ class Git:
         if(path == None or path.count(".git") == 0 or path == ''):
             #not a valid repository
             return False
+        #skip spawning git when the path cannot be a url or local repository
+        #(not remembered since only git can tell for certain)
+        if(cls.URL_FORMAT.match(path) == None and os.path.exists(path) == False):
+            return False
 
         log.info("Checking ability to link to remote url "+path+"...")
         out,err = apt.execute('git', 'ls-remote', path, quiet=cls.QUIET, returnoutput=True)
@@ -265,6 +283,48 @@ class Git:
         return is_valid
 
 
+    @classmethod
+    def isEqualURL(cls, url1, url2):
+        '''
+        Tests if `url1` and `url2` point to the same repository, ignoring any 
+        trailing '/' or '.git'.
+
+        Parameters:
+            url1 (str): the lhs url
+            url2 (str): the rhs url
+        Returns:
+            (bool): true if url1 and url2 only differ cosmetically
+        '''
+        def norm(url):
+            url = url.rstrip('/')
+            if(url.endswith('.git')):
+                url = url[:len(url)-len('.git')]
+            return url.rstrip('/')
+
+        return norm(url1) == norm(url2)
+
+
+    @classmethod
+    def getVersion(cls):
+        '''
+        Returns the version of the installed git executable. Returns (0,0,0) if
+        it could not be determined.
+
+        Parameters:
+            None
+        Returns:
+            ((int, int, int)): major, minor, and patch numbers
+        '''
+        if(cls._Version == None):
+            out,_ = apt.execute('git', '--version', quiet=True, returnoutput=True)
+            #format: git version 2.34.1 (platform suffixes may follow)
+            m = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', out)
+            cls._Version = (0,0,0)
+            if(m != None):
+                cls._Version = (int(m.group(1)), int(m.group(2)), int(m.group(3) or 0))
+        return cls._Version
+
+
     @classmethod
     def setRepoProperties(cls, path, valid=None, blank=None):
         #set up new path to collect info on
@@ -12,14 +12,23 @@
 #   supported languages: VHDL or verilog.
 # ------------------------------------------------------------------------------
 
-import re
+import os, re, shutil, pickle, hashlib
 from abc import ABC, abstractmethod
 
 from .apparatus import Apparatus as apt
+from .__version__ import __version__
 
 
 class Language(ABC):
 
+    #layout of the statements kept in apt.HDL_CACHE (increase when spinCode changes)
+    STREAM_FORMAT = 1
+
+    #number of entries allowed in apt.HDL_CACHE before the least recent are pruned
+    STREAM_CACHE_LIMIT = 2048
+
+    #determine if apt.HDL_CACHE has been pruned during this run
+    _StreamCachePruned = False
 
     def __init__(self, fpath, block):
         '''
@@ -134,6 +143,8 @@ class Language(ABC):
         Uses _join_dots (bool) to determine if to join left and right side of dots together
         
         Dynamically creates attr _code_stream so the operation can be reused.
+        The result is also kept in apt.HDL_CACHE and reused by later runs while
+        the file's contents are unchanged.
 
         Parameters:
             None
@@ -144,6 +155,32 @@ class Language(ABC):
         if(hasattr(self, "_code_stream")):
             return self._code_stream
 
+        #reuse the statements from a previous run if the file has not changed since
+        cache_file,stamp = self._getStreamCache()
+        if(stamp != None):
+            cached_stamp,cached_stream = None,None
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached_stamp,cached_stream = pickle.load(f)
+            #no entry exists (or cannot be read)
+            except OSError:
+                pass
+            #a truncated or corrupt entry is dropped and the file tokenized again
+            except Exception:
+                cached_stamp = None
+                try:
+                    os.remove(cache_file)
+                except OSError:
+                    pass
+            if(cached_stamp == stamp and isinstance(cached_stream, list)):
+                #mark as recently used to survive pruning
+                try:
+                    os.utime(cache_file)
+                except OSError:
+                    pass
+                self._code_stream = cached_stream
+                return self._code_stream
+
         self._code_stream = []
 
         #current statement
@@ -269,9 +306,96 @@ class Language(ABC):
             #if(self.getPath().endswith('adder.vhd')):
                 #print(cs)
             pass
+
+        #store the statements for later runs (best effort)
+        if(stamp != None):
+            try:
+                Language.pruneStreamCache()
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(cache_file, 'wb') as f:
+                    pickle.dump((stamp, self._code_stream), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass
         return self._code_stream
 
 
+    def _getStreamCache(self):
+        '''
+        Locates this file's entry in the tokenized HDL cache. Entries are named
+        by the language and the file's contents, so copies of a file share one.
+
+        Parameters:
+            None
+        Returns:
+            cache_file (str): path to the cache entry (None if file is unreadable)
+            stamp ((str, str)): language and digest of the file's contents (None if unreadable)
+        '''
+        #separate entries per language since each tokenizes differently
+        lang = type(self).__name__
+        #hash the contents (timestamps can be too coarse to notice quick same-size edits)
+        try:
+            with open(self.getPath(), 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None,None
+        cache_file = Language.getStreamCacheDir()+lang+'-'+digest
+        return cache_file,(lang, digest)
+
+
+    @classmethod
+    def getStreamCacheDir(cls):
+        '''
+        Returns the directory within apt.HDL_CACHE for entries written by this
+        legohdl version and statement layout.
+
+        Parameters:
+            None
+        Returns:
+            (str): path to the cache directory
+        '''
+        return apt.HDL_CACHE+__version__+'-'+str(cls.STREAM_FORMAT)+'/'
+
+
+    @classmethod
+    def pruneStreamCache(cls):
+        '''
+        Removes entries left by other legohdl versions or statement layouts, and
+        the least recently used entries when exceeding STREAM_CACHE_LIMIT. Only
+        runs once per run.
+
+        Parameters:
+            None
+        Returns:
+            None
+        '''
+        if(cls._StreamCachePruned):
+            return
+        cls._StreamCachePruned = True
+        if(os.path.isdir(apt.HDL_CACHE) == False):
+            return
+        cur_dir = cls.getStreamCacheDir()
+        #drop everything not belonging to the current cache directory
+        with os.scandir(apt.HDL_CACHE) as it:
+            entries = list(it)
+        for e in entries:
+            if(apt.HDL_CACHE+e.name+'/' == cur_dir):
+                continue
+            if(e.is_dir(follow_symlinks=False)):
+                shutil.rmtree(e.path, onerror=apt.rmReadOnly)
+            else:
+                os.remove(e.path)
+        if(os.path.isdir(cur_dir) == False):
+            return
+        #keep the most recently used half once the limit is exceeded
+        with os.scandir(cur_dir) as it:
+            entries = list(it)
+        if(len(entries) > cls.STREAM_CACHE_LIMIT):
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for e in entries[:len(entries)-cls.STREAM_CACHE_LIMIT//2]:
+                os.remove(e.path)
+        pass
+
+
     def getAbout(self):
         '''
         Read the beginning of the file and return all the text hidden in comments,
@@ -402,23 +526,22 @@ class Language(ABC):
         Returns:
             None
         '''
-        data = []
+        if(len(name_pairs) == 0):
+            return
+        #map each lower-case name to its replacement (first pair wins)
+        replacements = dict()
+        for pair in name_pairs:
+            replacements.setdefault(pair[0].lower(), pair[1])
+        #replace pairs only that have complete word, all names in one pass
+        expression = re.compile('\\b('+'|'.join([re.escape(n) for n in replacements.keys()])+')\\b', re.IGNORECASE)
         #open the file
         with open(self.getPath(), 'r') as f:
-            data = f.readlines()
-            #iterate through every name pair to find/replace
-            for pair in name_pairs:
-                #replace pairs only that have complete word
-                expression = re.compile('\\b'+pair[0]+'\\b', re.IGNORECASE)
-                #iterate through every line of the file data
-                for i in range(len(data)):
-                    data[i] = expression.sub(pair[1], data[i])
-                pass
-            pass
+            data = f.read()
+        data = expression.sub(lambda m: replacements[m.group(0).lower()], data)
 
         #rewrite the file with new replacements
         with open(self.getPath(), 'w') as f:
-            f.writelines(data)
+            f.write(data)
         pass
 
 
@@ -17,7 +17,6 @@ from posixpath import dirname
 import logging as log
 
 from .__version__ import __version__
-from .test import main as test
 
 from .apparatus import Apparatus as apt
 from .cfg import Cfg, Section, Key
@@ -30,7 +29,6 @@ from .label import Label
 from .git import Git
 from .map import Map
 from .unit import Unit
-from .gui import GUI
 
 
 class legoHDL:
@@ -114,6 +112,8 @@ class legoHDL:
         #print(self)
 
         if('debug' == self._command):
+            #only import the debugging script when requested
+            from .test import main as test
             test()
         else:
             self.runCommand()
@@ -500,7 +500,7 @@ Enter:
                     path = None
                     #if partial version check its specific version path
                     if(b.getLvl() == Block.Level.VER):
-                        root,_ = os.path.split(b.getPath()[:len(b.getPath())-1])
+                        root,_ = os.path.split(b.getPath()[:-1])
                         path = root+'/v'+b.getVersion()+'/'
 
                     paths = b.gatherSources(ext=lbl.getExtensions(), path=path)
@@ -677,8 +677,8 @@ Enter:
 
             #add component declaration
             pkg_data += [dsgn.getInterface().writeDeclaration(form=Unit.Language.VHDL, \
-                align=apt.CFG.get('HDL-styling.auto-fit', dtype=bool), \
-                hang_end=apt.CFG.get('HDL-styling.hanging-end', dtype=bool), \
+                align=Block.getStyling()['auto-fit'], \
+                hang_end=Block.getStyling()['hanging-end'], \
                 tabs=1)]
             #add newline
             pkg_data += [' ']
@@ -960,10 +960,10 @@ Enter:
             Profile.Jar[self.getItem(raw=True)].importLoadout(ask=self.hasFlag('ask'))
             return
 
-        #generate list of all available keys/editable sections
-        editable_keys = apt.CFG.getAllKeys()
-        create_keys = ['vendor', 'plugin', 'placeholders',]
-        editable_sects = apt.OPTIONS
+        #generate set of all available keys/editable sections for membership tests
+        editable_keys = set(apt.CFG.getAllKeys())
+        create_keys = frozenset(['vendor', 'plugin', 'placeholders',])
+        editable_sects = frozenset(apt.OPTIONS)
 
         link = False
         unlink = False
@@ -1166,6 +1166,8 @@ Enter:
             if(apt.CFG._modified):
                 apt.CFG.write()
                 log.info("Updated settings.")
+                #author/placeholders may have changed
+                Block.clearPlaceholders()
 
             Vendor.save()
             Workspace.save()
@@ -1389,7 +1391,8 @@ Enter:
                 Label.load()
                 #load plugin
                 Plugin.load()
-                #enable GUI
+                #enable GUI (tkinter is only imported when needed)
+                from .gui import GUI
                 settings_gui = GUI()
                 #adjust success if initialization failed
                 gui_mode = settings_gui.initialized() 
@@ -1414,7 +1417,7 @@ Enter:
             #boot-up plugins
             Plugin.load()
             #want to open the specified plugin?
-            plugin_path = apt.fs(apt.HIDDEN+"plugins/")
+            plugin_path = apt.fs(apt.PLUGINS)
 
             #maybe open up the plugin file directly if given a value
             if(self._item.lower() in Plugin.Jar.keys()):
@@ -71,4 +71,8 @@ class Map(MutableMapping):
     def values(self):
         return self._inventory.values()
 
+
+    def setdefault(self, k, default=None):
+        return self._inventory.setdefault(self._keytransform(k), default)
+
     pass
\ No newline at end of file
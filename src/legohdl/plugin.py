@@ -19,6 +19,9 @@ class Plugin:
 
     #store all plugins in class variable
     Jar = Map()
+
+    #remember which command words were checked as existing paths
+    _PathStatus = dict()
     
 
     def __init__(self, alias, cmd_call):
@@ -102,7 +105,10 @@ class Plugin:
 
         #from the remaining words try to guess which is plugin path (if exists)
         for word in cmd_parts[1:]:
-            if(os.path.exists(os.path.expandvars(word))):
+            #only stat each unique word once across all plugins
+            if(word not in self._PathStatus.keys()):
+                self._PathStatus[word] = os.path.exists(os.path.expandvars(word))
+            if(self._PathStatus[word]):
                 self._path = word
                 break
         else:
@@ -9,7 +9,7 @@
 #   users.
 # ------------------------------------------------------------------------------
 
-import os,shutil,glob
+import os,shutil
 import logging as log
 
 from .apparatus import Apparatus as apt
@@ -25,7 +25,7 @@ class Profile:
 
     LastImport = None
 
-    DIR = apt.fs(apt.HIDDEN+"profiles/")
+    DIR = apt.fs(apt.PROFILES)
     EXT = ".prfl"
     LOG_FILE = "import.log"
 
@@ -94,7 +94,7 @@ class Profile:
         '''
         success = True
 
-        if(Git.isValidRepo(url, True) == False and Git.isValidRepo(url, False) == False):
+        if(Git.isValidRepo(url, False) == False and Git.isValidRepo(url, True) == False):
             log.error("Invalid repository "+url+".")
             return False
 
@@ -107,14 +107,11 @@ class Profile:
 
             #determine if a .prfl file exists
             log.info("Locating .prfl file... ")
-            files = os.listdir(apt.TMP)
-            for f in files:
-                prfl_i = f.find(self.EXT)
-                if(prfl_i > -1):
-                    #remove extension to get the profile's name
-                    self._name = f[:prfl_i]
-                    log.info("Identified profile "+self.getName())
-                    break
+            prfl_name = self._findProfileName(apt.TMP)
+            if(prfl_name != None):
+                #remove extension to get the profile's name
+                self._name = prfl_name
+                log.info("Identified profile "+self.getName())
             else:
                 log.error("Invalid profile; could not locate .prfl file.")
                 success = False
@@ -153,13 +150,15 @@ class Profile:
         s_file = self.getProfileDir()+apt.SETTINGS_FILE
 
         prfl_settings = None
+        #check the profile's contents only once
+        has_settings = self.hasSettings()
         #load the profile's configured settings
-        if(self.hasSettings()):
+        if(has_settings):
             prfl_settings = Cfg(s_file, data=Section())
             prfl_settings.read()
 
         #overload available settings
-        if(self.hasSettings()):
+        if(has_settings):
             act = (ask == False) or apt.confirmation("Import "+apt.SETTINGS_FILE+"?", warning=False)
             if(act):
                 log.info('Overloading '+apt.SETTINGS_FILE+'...')
@@ -175,7 +174,7 @@ class Profile:
                 shutil.rmtree(apt.HIDDEN+"template/",onerror=apt.rmReadOnly)
                 shutil.copytree(self.getProfileDir()+"template/", apt.HIDDEN+"template/")
                 #update template key
-                if(self.hasSettings()):
+                if(has_settings):
                     log.info("Overloading template in "+apt.SETTINGS_FILE+"...")
                     apt.CFG.set('general.template', prfl_settings.get('general.template', dtype=str), verbose=True)
                 pass
@@ -195,7 +194,7 @@ class Profile:
                     if(os.path.isfile(self.getProfileDir()+'plugins/'+plg)):
                         #copy contents into built-in plugin folder
                         prfl_plugin = open(self.getProfileDir()+'plugins/'+plg, 'r')
-                        copied_plugin = open(apt.HIDDEN+'plugins/'+plg, 'w')
+                        copied_plugin = open(apt.PLUGINS+plg, 'w')
 
                         #transfer file data via writing it to file
                         plugin_data = prfl_plugin.readlines()
@@ -207,7 +206,7 @@ class Profile:
                         pass
                     pass
                 #update settings for plugins
-                if(self.hasSettings()):
+                if(has_settings):
                     log.info('Overloading plugins in '+apt.SETTINGS_FILE+'...')
                     #update plugin section
                     apt.CFG.set('plugin', prfl_settings.get('plugin', dtype=Section), verbose=True)
@@ -373,20 +372,39 @@ class Profile:
         Returns:
             None
         '''
-        #list all profiles
-        prfl_files = glob.glob(cls.DIR+"**/*"+cls.EXT, recursive=True)
-        for f in prfl_files:
-            prfl_name = os.path.basename(f).replace(cls.EXT,'')
-            #remove a profile that is not found in settings (Jar class container)
-            if(prfl_name.lower() not in cls.Jar.keys()):
-                log.info("Removing stale profile "+prfl_name+"...")
-                prfl_dir = f.replace(os.path.basename(f),'')
-
-                shutil.rmtree(prfl_dir, onerror=apt.rmReadOnly)
-            pass
+        #list all profiles (a .prfl file is at the root of each profile directory)
+        with os.scandir(cls.DIR) as prfl_dirs:
+            for d in prfl_dirs:
+                if(d.is_dir() == False):
+                    continue
+                prfl_name = cls._findProfileName(d.path)
+                #remove a profile that is not found in settings (Jar class container)
+                if(prfl_name != None and prfl_name.lower() not in cls.Jar.keys()):
+                    log.info("Removing stale profile "+prfl_name+"...")
+                    shutil.rmtree(apt.fs(d.path), onerror=apt.rmReadOnly)
+                pass
         pass
 
 
+    @classmethod
+    def _findProfileName(cls, path):
+        '''
+        Returns the name of the first .prfl file found directly within the
+        'path' directory. Stops scanning once one is found.
+
+        Parameters:
+            path (str): directory to search
+        Returns:
+            (str): the profile's name (filename without extension) or None if DNE
+        '''
+        with os.scandir(path) as entries:
+            for e in entries:
+                prfl_i = e.name.find(cls.EXT)
+                if(prfl_i > -1 and e.is_file()):
+                    return e.name[:prfl_i]
+        return None
+
+
     def setName(self, n):
         '''
         Change the profile's name if the name is not already taken.
@@ -512,12 +530,25 @@ class Profile:
 
     def hasTemplate(self):
         '''Returns (bool) if a template folder exists and has at least one file.'''
-        return os.path.exists(self.getProfileDir()+"template/") and len(os.listdir(self.getProfileDir()+"template/"))
+        return self._hasEntries(self.getProfileDir()+"template/")
 
 
     def hasPlugins(self):
         '''Returns (bool) if a plugins folder exists and has at least one file.'''
-        return os.path.exists(self.getProfileDir()+"plugins/") and len(os.listdir(self.getProfileDir()+"plugins/"))
+        return self._hasEntries(self.getProfileDir()+"plugins/")
+
+
+    @classmethod
+    def _hasEntries(cls, path):
+        '''
+        Returns (bool) if the directory exists and is not empty. Stops scanning
+        at the first entry found rather than listing the entire directory.
+        '''
+        try:
+            with os.scandir(path) as entries:
+                return any(True for _ in entries)
+        except OSError:
+            return False
 
 
     def hasSettings(self):
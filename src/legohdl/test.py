@@ -311,6 +311,18 @@ def main():
         #clean up test block
         if(success):
             shutil.rmtree(test_path, onerror=apt.rmReadOnly)
+
+    if(True):
+        print('\n---BLOCK VERSION CHAINS---')
+        #with a version chain
+        assert(Block.trimVerChain('lib.name(v1.0-@v1.0.2)') == 'lib.name(@v1.0.2)')
+        assert(Block.trimVerChain('vndr.lib.name(v1-v1.0-@v1.0.2)') == 'vndr.lib.name(@v1.0.2)')
+        assert(Block.trimVerChain('lib.name(@v1.0.2)') == 'lib.name(@v1.0.2)')
+        #without a version chain in parentheses
+        assert(Block.trimVerChain('v1.0-@v1.0.2') == '@v1.0.2')
+        assert(Block.trimVerChain('@v1.0.2') == '@v1.0.2')
+        print('passed')
+
     if(True):
         comments = {}
 
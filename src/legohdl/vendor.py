@@ -21,7 +21,7 @@ class Vendor:
     #store all vendors in class container
     Jar = Map()
 
-    DIR = apt.fs(apt.HIDDEN+"vendors/")
+    DIR = apt.fs(apt.VENDORS)
     EXT = ".vndr"
     
     def __init__(self, name, url=None):
@@ -94,7 +94,7 @@ class Vendor:
         '''
         success = True
 
-        if(Git.isValidRepo(url, remote=True) == False and Git.isValidRepo(url, remote=False) == False):
+        if(Git.isValidRepo(url, remote=False) == False and Git.isValidRepo(url, remote=True) == False):
             log.error("Invalid repository "+url+".")
             return False
 
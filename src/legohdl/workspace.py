@@ -8,7 +8,7 @@
 #   "organization".
 # ------------------------------------------------------------------------------
 
-import os, shutil, glob
+import os, shutil, glob, bisect
 import logging as log
 from datetime import datetime
 
@@ -28,7 +28,7 @@ class Workspace:
     #active-workspace is a workspace object
     _ActiveWorkspace = None
 
-    DIR = apt.fs(apt.HIDDEN+"workspaces/")
+    DIR = apt.fs(apt.WORKSPACE)
     LOG_FILE = "refresh.log"
 
     MIN_RATE = -1
@@ -80,15 +80,22 @@ class Workspace:
                         exit(log.info("Workspace not created."))
         
         self._ws_dir = apt.fs(self.DIR+self.getName()+"/")
+        self._cache_path = self._ws_dir+"cache/"
         
-        #ensure all workspace hidden directories exist
-        if(os.path.isdir(self.getDir()) == False):
+        #list the workspace's hidden directory once to see what already exists
+        existing = []
+        try:
+            with os.scandir(self.getDir()) as entries:
+                existing = [e.name for e in entries]
+        except FileNotFoundError:
+            #ensure all workspace hidden directories exist
             log.info("Setting up workspace "+self.getName()+"...")
             os.makedirs(self.getDir(), exist_ok=True)
         #create workspace's cache where installed blocks will be stored
-        os.makedirs(self.getDir()+"cache", exist_ok=True)
+        if("cache" not in existing):
+            os.makedirs(self.getDir()+"cache", exist_ok=True)
         #create the refresh log if DNE
-        if(os.path.isfile(self.getDir()+self.LOG_FILE) == False):
+        if(self.LOG_FILE not in existing):
             open(self.getDir()+self.LOG_FILE, 'w').close()
 
         self._vendors = []
@@ -164,6 +171,7 @@ class Workspace:
                 os.rename(self.getDir(), new_dir)
             #set the hidden workspace directory
             self._ws_dir = new_dir
+            self._cache_path = self._ws_dir+"cache/"
 
             #change to new name
             self._name = n
@@ -209,6 +217,7 @@ class Workspace:
             else:
                 log.info("Linking vendor "+vndr_obj.getName()+" to the workspace...")
                 self._vendors += [vndr_obj]
+                self._clearVendorNames()
                 return True
         else:
             log.warning("Could not link unknown vendor "+vndr+" to "+self.getName()+".")
@@ -226,6 +235,7 @@ class Workspace:
         '''
         #reset vendors list
         self._vendors = []
+        self._clearVendorNames()
         success = True
         #iterate through every given vendor
         for vndr in vndrs:
@@ -262,6 +272,7 @@ class Workspace:
             else:
                 log.info("Unlinking vendor "+vndr_obj.getName()+" from the workspace...")
                 self._vendors.remove(vndr_obj)
+                self._clearVendorNames()
                 return True
         else:
             log.warning("Could not unlink unknown vendor "+vndr+" from "+self.getName()+".")
@@ -373,6 +384,40 @@ class Workspace:
         Sometimes an entity is required for certain commands; so it can be
         assumed entity (instead of block name) if only thing given.
 
+        Searches by block title alone are remembered for the same list of
+        blocks in the _shortcuts attr.
+
+        Parameters:
+            title (str): partial or full M.L.N with optional E attached
+            req_entity (bool): determine if only thing given then it is an entity
+            visibility (bool): determine if to only look for visible blocks
+            ref_current (bool): determine if to try to assign empty title to current block
+        Returns:
+            (Block): the identified block from the shortened title
+        '''
+        #only searches on a title (no entity, not the current block) are reused
+        if(title == None or title == '' or req_entity or title.count(apt.ENTITY_DELIM)):
+            return self._searchShortcut(title, req_entity, visibility, ref_current)
+
+        #load all necessary blocks first (fills the inventory for getAllBlocks)
+        blocks = self.loadBlocks()
+        if(visibility == False):
+            blocks = Block.getAllBlocks()
+        #forget previous searches if the list of blocks is a different one or
+        #has grown since (it is filled in place while blocks are being loaded)
+        if(hasattr(self, '_shortcuts') == False or self._shortcuts[0] is not blocks or \
+            self._shortcuts[1] != len(blocks)):
+            self._shortcuts = (blocks, len(blocks), dict())
+        key = (title, visibility)
+        if(key not in self._shortcuts[2].keys()):
+            self._shortcuts[2][key] = self._searchShortcut(title, req_entity, visibility, ref_current)
+        return self._shortcuts[2][key]
+
+
+    def _searchShortcut(self, title, req_entity, visibility, ref_current):
+        '''
+        Performs the block search for shortcut().
+
         Parameters:
             title (str): partial or full M.L.N with optional E attached
             req_entity (bool): determine if only thing given then it is an entity
@@ -662,19 +707,23 @@ class Workspace:
         M,L,N,V,E = Block.snapTitle(title, inc_ent=True)
         #print(M,L,N,V,E)
 
+        #read the setting for multi-develop and lower-case the search terms once
+        mult_dev = apt.getMultiDevelop()
+        M_l, L_l, N_l, E_l = M.lower(), L.lower(), N.lower(), E.lower()
+
         #store each entity's print line in map (key = <unit>:<block-id>) to ensure uniqueness
         catalog = Map()
         for bk in Block.getAllBlocks():
             #for lvl in Block.Inventory[bk.M()][bk.L()][bk.N()]:
             block_title = bk.getFull(inc_ver=False)
-            if(bk.M().lower().startswith(M.lower()) == False):
+            if(bk.M().lower().startswith(M_l) == False):
                 continue
-            if(bk.L().lower().startswith(L.lower()) == False):
+            if(bk.L().lower().startswith(L_l) == False):
                 continue
-            if(bk.N().lower().startswith(N.lower()) == False):
+            if(bk.N().lower().startswith(N_l) == False):
                 continue
             #collect all units
-            if(apt.getMultiDevelop() == False):
+            if(mult_dev == False):
                 if(bk.getLvlBlock(Block.Level.INSTL) != None):
                     bk = bk.getLvlBlock(Block.Level.INSTL)
                 #skip this block if only displaying usable units and multi-develop off
@@ -684,7 +733,7 @@ class Workspace:
             units = bk.loadHDL(returnnames=False).values()
 
             for u in units:
-                if(len(E) and u.E().lower().startswith(E.lower()) == False):
+                if(len(E) and u.E().lower().startswith(E_l) == False):
                     continue
                 if(ignore_tb and u.isTb()):
                     continue
@@ -727,15 +776,15 @@ class Workspace:
             None
         '''
         #list all hidden workspace directories
-        hidden_dirs = os.listdir(cls.DIR)
-        for hd in hidden_dirs:
-            if(hd.lower() not in cls.Jar.keys()):
-                log.info("Removing stale workspace data for "+hd+"...") 
-                if(os.path.isdir(cls.DIR+hd)):
-                    shutil.rmtree(cls.DIR+hd, onerror=apt.rmReadOnly)
-                #remove all files from workspace directory
-                else:
-                    os.remove(cls.DIR+hd)
+        with os.scandir(cls.DIR) as hidden_dirs:
+            for hd in hidden_dirs:
+                if(hd.name.lower() not in cls.Jar.keys()):
+                    log.info("Removing stale workspace data for "+hd.name+"...") 
+                    if(hd.is_dir()):
+                        shutil.rmtree(cls.DIR+hd.name, onerror=apt.rmReadOnly)
+                    #remove all files from workspace directory
+                    else:
+                        os.remove(cls.DIR+hd.name)
         pass
 
 
@@ -760,12 +809,8 @@ class Workspace:
             Returns:
                 (float): 0.00 (inclusive) - 24.00 (exclusive)
             '''
-            time_stamp = str(prt).split(' ')[1]
-            time_sects = time_stamp.split(':')
-            hrs = int(time_sects[0])
             #convert to 'hours'.'minutes'
-            time_fmt = (float(hrs)+(float(float(time_sects[1])/60)))
-            return time_fmt
+            return prt.hour + (prt.minute/60.0)
 
 
         refresh = False
@@ -783,9 +828,7 @@ class Workspace:
         #divide the 24 hour period into even checkpoints
         max_hours = float(24)
         spacing = float(max_hours / rate)
-        intervals = []
-        for i in range(rate):
-            intervals += [spacing*i]
+        intervals = [spacing*i for i in range(rate)]
         
         #ensure log file exists
         if(os.path.exists(self.getDir()+self.LOG_FILE) == False):
@@ -794,24 +837,23 @@ class Workspace:
         #read log file
         #read when the last refresh time occurred
         with open(self.getDir()+self.LOG_FILE, 'r') as log_file:
-            #read the latest date
-            data = log_file.readlines()
+            #read the latest date (only the first line is ever needed)
+            data = log_file.readline().strip()
             #no refreshes have occurred so automatically need a refresh
             if(len(data) == 0):
                 last_punch = cur_time
                 refresh = True
             else:
-                last_punch = datetime.fromisoformat(data[0])
+                last_punch = datetime.fromisoformat(data)
                 #determine if its time to refresh
                 #get latest time that was punched
                 last_time_fmt = timeToFloat(last_punch)
-                #determine the next checkpoint available for today
+                #determine the next checkpoint available for today (intervals are sorted)
                 next_checkpoint = max_hours
-                for i in range(len(intervals)):
-                    if(last_time_fmt < intervals[i]):
-                        next_checkpoint = intervals[i]
-                        stage = i + 1
-                        break
+                i = bisect.bisect_right(intervals, last_time_fmt)
+                if(i < len(intervals)):
+                    next_checkpoint = intervals[i]
+                    stage = i + 1
                 #print('next checkpoint',next_checkpoint)
                 cur_time_fmt = timeToFloat(cur_time)
                 #check if the time has occurred on a previous day, (automatically update because its a new day)
@@ -976,7 +1018,7 @@ class Workspace:
 
     def getCachePath(self):
         '''Returns the hidden directory where workspace installations are kept. (str).'''
-        return self.getDir()+"cache/"
+        return self._cache_path
 
 
     def getName(self):
@@ -1001,16 +1043,44 @@ class Workspace:
             
         '''
         if(returnnames):
-            vndr_names = []
-            for vndr in self._vendors:
-                name = vndr.getName()
-                if(lowercase):
-                    name = name.lower()
-                vndr_names += [name]
-            return vndr_names
+            #build the names once until the linked vendors change
+            if(hasattr(self, '_vendor_names') == False):
+                self._cacheVendorNames()
+            return self._vendor_names[0] if(lowercase) else self._vendor_names[1]
         else:
             return self._vendors
 
+
+    def hasVendor(self, name):
+        '''
+        Returns (bool) if a vendor by the case-insensitive `name` is linked to 
+        this workspace. Uses a set of the names built once until the linked 
+        vendors change.
+
+        Parameters:
+            name (str): vendor name to look for
+        Returns:
+            (bool): if the vendor is linked to the workspace
+        '''
+        if(hasattr(self, '_vendor_names') == False):
+            self._cacheVendorNames()
+        return name.lower() in self._vendor_names[2]
+
+
+    def _cacheVendorNames(self):
+        '''Creates the _vendor_names attr: lower-case names, true names, and a set of lower-case names.'''
+        true_names = [vndr.getName() for vndr in self._vendors]
+        low_names = [n.lower() for n in true_names]
+        self._vendor_names = (low_names, true_names, frozenset(low_names))
+        pass
+
+    
+    def _clearVendorNames(self):
+        '''Removes the cached _vendor_names attr after the linked vendors change.'''
+        if(hasattr(self, '_vendor_names')):
+            delattr(self, '_vendor_names')
+        pass
+
     
     @classmethod
     def printList(cls):